@@ -2,31 +2,97 @@
 Base Agent Class
 All specialized agents inherit from this
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-from utils.claude_api import ClaudeAPI
+from dataclasses import fields
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, List, Optional, Type, TypeVar
+from pydantic import BaseModel
+from agents.context import IdeationContext
+from utils.claude_api import ClaudeAPI, Content, cached_system, content_text
+from utils.llm_cache import LLMCache, get_llm_cache
+from utils.semantic_cache import get_semantic_cache
+
+# Structured output carries no markdown scaffolding, so it needs fewer tokens
+STRUCTURED_TOKEN_RATIO = 0.7
+
+T = TypeVar("T")
+
+
+def build_shared_context(idea: str, research: str) -> List[Dict[str, Any]]:
+    """
+    Build the context block shared by all downstream agents
+
+    It is placed first in the system prompt and marked cacheable, so the
+    idea + research prefix is processed once and reused by every agent.
+    """
+    return [{
+        "type": "text",
+        "text": f"PROJECT IDEA:\n{idea}\n\nMARKET RESEARCH:\n{research}",
+        "cache_control": {"type": "ephemeral"}
+    }]
+
+
+class _TemplateFields:
+    """format_map view over a context: extras first, then context attributes, else ''"""
+
+    __slots__ = ("context", "extra")
+
+    def __init__(self, context: IdeationContext, extra: Dict[str, Any]):
+        self.context = context
+        self.extra = extra
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.extra:
+            return self.extra[key]
+        value = getattr(self.context, key, None)
+        return "" if value is None else value
 
 
 class BaseAgent(ABC):
     """Base class for all agents"""
 
+    # str.format_map template over IdeationContext fields; missing keys render empty
+    USER_TEMPLATE: Optional[str] = None
+    # Pydantic model used in structured-output mode (must provide to_markdown())
+    OUTPUT_SCHEMA: Optional[Type[BaseModel]] = None
+
     def __init__(
         self,
         claude_api: ClaudeAPI,
         name: str,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.0
     ):
         self.claude = claude_api
         self.name = name
         self.max_tokens = max_tokens or 3000
+        # Deterministic by default so responses are reproducible and cacheable
+        self.temperature = temperature
+        self.cache = get_llm_cache(claude_api.config)
+        self.semantic_cache = get_semantic_cache(name, claude_api.config)
+        # Optional hook called with each streamed response chunk (e.g. for live UI)
+        self.stream_callback: Optional[Callable[[str], None]] = None
+        agents_config = claude_api.config.get("agents", {})
+        self.structured_output = (
+            self.OUTPUT_SCHEMA is not None
+            and agents_config.get("structured_output", False)
+        )
+        # Fire a duplicate request if the first hasn't answered after this long (off if unset)
+        hedge_ms = agents_config.get("hedge_after_ms")
+        self.hedge_after = hedge_ms / 1000 if hedge_ms else None
 
     @abstractmethod
     def get_system_prompt(self) -> str:
-        """Return the system prompt for this agent"""
+        """
+        Return the system prompt for this agent
+
+        Agents return a module-level SYSTEM_PROMPT constant: it must be
+        byte-identical on every call to keep hitting Anthropic's prompt cache.
+        """
         pass
 
     @abstractmethod
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
         """
         Run the agent with given context
 
@@ -38,20 +104,179 @@ class BaseAgent(ABC):
         """
         pass
 
-    def _create_user_message(self, context: Dict[str, Any]) -> str:
-        """Helper to format context into user message"""
-        # Default implementation - can be overridden
+    def _create_user_message(self, context: IdeationContext, **extra: Any) -> str:
+        """Helper to format context (plus extra template values) into user message"""
+        if self.USER_TEMPLATE is not None:
+            return self.USER_TEMPLATE.format_map(_TemplateFields(context, extra))
+
+        # Generic fallback for agents without a template - can be overridden
         parts = []
-        for key, value in context.items():
+        for f in fields(context):
+            parts.append(f"{f.name.upper()}:\n{getattr(context, f.name)}\n")
+        for key, value in extra.items():
             parts.append(f"{key.upper()}:\n{value}\n")
         return "\n".join(parts)
 
-    async def execute(self, user_message: str) -> str:
-        """Execute agent with custom message"""
+    def _shared_context(self, context: IdeationContext) -> List[Dict[str, Any]]:
+        """Return the shared context blocks, building them if the orchestrator didn't"""
+        shared = context.shared_context
+        if shared is None:
+            shared = build_shared_context(context.idea_description, context.research_report)
+        return shared
+
+    def _compose_system_prompt(self, shared_context: Optional[List[Dict[str, Any]]]) -> Content:
+        """Agent system prompt, preceded by the shared context blocks if given"""
         system_prompt = self.get_system_prompt()
-        response = self.claude.send_message(
+        if shared_context:
+            system_prompt = shared_context + cached_system(system_prompt)
+        return system_prompt
+
+    async def _hedged(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await call(), hedging with a second identical request after hedge_after seconds
+
+        Whichever request finishes first wins and the other is cancelled. Safe
+        because agent calls are idempotent (deterministic and cached).
+        """
+        if not self.hedge_after:
+            return await call()
+
+        first = asyncio.ensure_future(call())
+        try:
+            return await asyncio.wait_for(asyncio.shield(first), self.hedge_after)
+        except asyncio.TimeoutError:
+            pass
+
+        tasks = {first, asyncio.ensure_future(call())}
+        failed = []
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # exception() also marks each error as retrieved (no "never retrieved" log)
+                succeeded = [t for t in done if not t.cancelled() and t.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                failed.extend(done)
+            # Only surface a failure once both requests have failed
+            return failed[0].result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def execute(
+        self,
+        user_message: Content,
+        shared_context: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Execute agent with custom message (text or content blocks)
+
+        Args:
+            user_message: Agent-specific task
+            shared_context: Optional context blocks prepended to the system prompt
+        """
+        if self.structured_output:
+            report = await self.execute_structured(user_message, shared_context)
+            return report.to_markdown()
+
+        # Hedging needs the whole response at once, so only use it when nobody watches the stream
+        chunks = []
+        hedge = self.stream_callback is None
+        async for chunk in self.execute_stream(user_message, shared_context, hedge=hedge):
+            chunks.append(chunk)
+            if self.stream_callback:
+                self.stream_callback(chunk)
+        return "".join(chunks)
+
+    async def execute_stream(
+        self,
+        user_message: Content,
+        shared_context: Optional[List[Dict[str, Any]]] = None,
+        hedge: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Execute agent and yield the response as it is generated
+
+        Cache hits are yielded as a single chunk. With hedge=True (and
+        agents.hedge_after_ms set) the response is fetched with a hedged
+        non-streaming call and also yielded as a single chunk.
+        """
+        system_prompt = self._compose_system_prompt(shared_context)
+
+        key = LLMCache.key(
+            self.name, system_prompt, user_message, self.max_tokens, self.claude.model, self.temperature
+        )
+        cached = await self.cache.aget(key)
+        if cached:
+            yield cached
+            return
+
+        # Similarity must cover the shared idea/research, not just the (often static) task text
+        prompt_text = content_text(user_message)
+        if shared_context:
+            prompt_text = f"{content_text(shared_context)}\n\n{prompt_text}"
+        # Sampled calls (key is None) bypass the semantic cache as well
+        cached = await self.semantic_cache.aget(prompt_text) if key is not None else None
+        if cached:
+            await self.cache.aset(key, cached)
+            yield cached
+            return
+
+        if hedge and self.hedge_after:
+            response = await self._hedged(lambda: self.claude.asend_message(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            ))
+            yield response
+        else:
+            chunks = []
+            async for chunk in self.claude.astream_message(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            ):
+                chunks.append(chunk)
+                yield chunk
+            response = "".join(chunks)
+
+        await self.cache.aset(key, response)
+        if key is not None:
+            await self.semantic_cache.aset(prompt_text, response)
+
+    async def execute_structured(
+        self,
+        user_message: Content,
+        shared_context: Optional[List[Dict[str, Any]]] = None
+    ) -> BaseModel:
+        """
+        Execute agent with tool-use structured output, parsed into OUTPUT_SCHEMA
+
+        Args:
+            user_message: Agent-specific task
+            shared_context: Optional context blocks prepended to the system prompt
+        """
+        system_prompt = self._compose_system_prompt(shared_context)
+        max_tokens = int(self.max_tokens * STRUCTURED_TOKEN_RATIO)
+        schema = self.OUTPUT_SCHEMA.model_json_schema()
+
+        key = LLMCache.key(
+            f"{self.name}:structured", system_prompt, user_message, max_tokens,
+            self.claude.model, self.temperature, tools=schema
+        )
+        cached = await self.cache.aget(key)
+        if cached:
+            return self.OUTPUT_SCHEMA.model_validate_json(cached)
+
+        data = await self._hedged(lambda: self.claude.asend_structured(
             system_prompt=system_prompt,
             user_message=user_message,
-            max_tokens=self.max_tokens
-        )
-        return response
+            schema=schema,
+            max_tokens=max_tokens,
+            temperature=self.temperature
+        ))
+        report = self.OUTPUT_SCHEMA.model_validate(data)
+        await self.cache.aset(key, report.model_dump_json())
+        return report
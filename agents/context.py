@@ -0,0 +1,37 @@
+"""
+Ideation Context
+Typed state passed through the agent pipeline
+"""
+from dataclasses import dataclass, fields, replace
+from typing import Dict, Any, List, Optional, Sequence
+
+
+@dataclass(frozen=True, slots=True)
+class IdeationContext:
+    """
+    Inputs and agent outputs for one ideation run
+
+    Immutable: each phase produces a new snapshot (see merge), so agents
+    running in parallel all read the same consistent state.
+    """
+
+    idea_description: str
+    target_audience: str = "general users"
+    output_dir: str = ""
+    research_report: str = ""
+    # Cacheable idea + research block shared by the downstream agents
+    shared_context: Optional[List[Dict[str, Any]]] = None
+    features: str = ""
+    feature_items: Sequence[Dict[str, Any]] = ()
+    techstack: str = ""
+    reusable_assets: str = ""
+    similar_projects: Sequence[Dict[str, Any]] = ()
+    validation_report: str = ""
+    specification: Optional[Dict[str, Any]] = None
+
+    def merge(self, result: Dict[str, Any]) -> "IdeationContext":
+        """Return a copy with an agent result dict applied, ignoring keys that aren't context fields"""
+        return replace(self, **{key: value for key, value in result.items() if key in _FIELD_NAMES})
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(IdeationContext))
@@ -4,16 +4,11 @@ Creates MVP feature list with priorities
 """
 from typing import Dict, Any
 from agents.base_agent import BaseAgent
+from agents.context import IdeationContext
+from agents.schemas import FeaturePlan
 
 
-class FeaturePlannerAgent(BaseAgent):
-    """Plans features for MVP with clear priorities"""
-
-    def __init__(self, claude_api, max_tokens: int = 1500):
-        super().__init__(claude_api, "Feature Planner", max_tokens)
-
-    def get_system_prompt(self) -> str:
-        return """You are a product planning specialist focused on MVP development.
+SYSTEM_PROMPT = """You are a product planning specialist focused on MVP development.
 
 Your expertise:
 - Feature prioritization using MoSCoW method
@@ -41,30 +36,45 @@ OUTPUT FORMAT (Markdown):
 
 Keep it focused on what's truly essential for launch."""
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Create feature plan
 
-        Args:
-            context: Must contain 'idea_description', 'research_report'
+class FeaturePlannerAgent(BaseAgent):
+    """Plans features for MVP with clear priorities"""
 
-        Returns:
-            Dict with features (markdown)
-        """
-        idea = context.get('idea_description', '')
-        research = context.get('research_report', '')
+    OUTPUT_SCHEMA = FeaturePlan
+    USER_TEMPLATE = """Create an MVP feature plan for the project idea above, using the market research.
 
-        user_message = f"""Create an MVP feature plan for this project:
+Create a focused MVP feature list following the format."""
 
-PROJECT IDEA:
-{idea}
+    def __init__(self, claude_api, max_tokens: int = 1500):
+        super().__init__(claude_api, "Feature Planner", max_tokens)
 
-MARKET RESEARCH:
-{research}
+    def get_system_prompt(self) -> str:
+        return SYSTEM_PROMPT
 
-Create a focused MVP feature list following the format."""
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
+        """
+        Create feature plan
+
+        Args:
+            context: Needs idea_description, research_report (or shared_context)
 
-        response = await self.execute(user_message)
+        Returns:
+            Dict with features (markdown), plus feature_items in structured-output mode
+        """
+        user_message = self._create_user_message(context)
+        shared_context = self._shared_context(context)
+
+        if self.structured_output:
+            # Keep the parsed features so the publisher can skip markdown parsing
+            plan = await self.execute_structured(user_message, shared_context=shared_context)
+            return {
+                "features": plan.to_markdown(),
+                "feature_items": [feature.model_dump() for feature in plan.features],
+                "agent_name": self.name,
+                "status": "completed"
+            }
+
+        response = await self.execute(user_message, shared_context=shared_context)
 
         return {
             "features": response,
@@ -4,16 +4,11 @@ Analyzes market, competitors, and opportunities
 """
 from typing import Dict, Any
 from agents.base_agent import BaseAgent
+from agents.context import IdeationContext
+from agents.schemas import ResearchReport
 
 
-class ResearchAgent(BaseAgent):
-    """Conducts market research and competitor analysis"""
-
-    def __init__(self, claude_api, max_tokens: int = 3000):
-        super().__init__(claude_api, "Research Agent", max_tokens)
-
-    def get_system_prompt(self) -> str:
-        return """You are a market research specialist with expertise in:
+SYSTEM_PROMPT = """You are a market research specialist with expertise in:
 - Market analysis and opportunity identification
 - Competitor research and gap analysis
 - Technology trends and adoption patterns
@@ -42,30 +37,39 @@ OUTPUT FORMAT (Markdown):
 
 Be realistic but optimistic. Focus on actionable insights."""
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Run market research analysis
-
-        Args:
-            context: Must contain 'idea_description', optionally 'target_audience'
 
-        Returns:
-            Dict with research_report (markdown string)
-        """
-        idea = context.get('idea_description', '')
-        target_audience = context.get('target_audience', 'general users')
+class ResearchAgent(BaseAgent):
+    """Conducts market research and competitor analysis"""
 
-        user_message = f"""Analyze this project idea:
+    OUTPUT_SCHEMA = ResearchReport
+    USER_TEMPLATE = """Analyze this project idea:
 
 PROJECT IDEA:
-{idea}
+{idea_description}
 
 TARGET AUDIENCE:
 {target_audience}
 
 Provide comprehensive market research following the format specified."""
 
-        response = await self.execute(user_message)
+    def __init__(self, claude_api, max_tokens: int = 3000):
+        # Some creativity is wanted for market research (never exact-cached)
+        super().__init__(claude_api, "Research Agent", max_tokens, temperature=0.5)
+
+    def get_system_prompt(self) -> str:
+        return SYSTEM_PROMPT
+
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
+        """
+        Run market research analysis
+
+        Args:
+            context: Needs idea_description, optionally target_audience
+
+        Returns:
+            Dict with research_report (markdown string)
+        """
+        response = await self.execute(self._create_user_message(context))
 
         return {
             "research_report": response,
@@ -2,20 +2,19 @@
 Reusability Scout Agent
 Identifies reusable components from past projects
 """
-from typing import Dict, Any
+import asyncio
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Any, List
 from agents.base_agent import BaseAgent
+from agents.context import IdeationContext
 from utils.archon_rag import get_archon_rag
+from utils import fast_json
+from utils.llm_cache import LLMCache
 
 
-class ReusabilityScoutAgent(BaseAgent):
-    """Finds reusable components and patterns"""
-
-    def __init__(self, claude_api, max_tokens: int = 800):
-        super().__init__(claude_api, "Reusability Scout", max_tokens)
-        self.archon_rag = get_archon_rag()
-
-    def get_system_prompt(self) -> str:
-        return """You are a code reusability specialist.
+SYSTEM_PROMPT = """You are a code reusability specialist.
 
 Your task: Identify opportunities to reuse code, components, and patterns from past projects.
 
@@ -45,23 +44,120 @@ OUTPUT FORMAT (Markdown):
 
 Focus on realistic reusability - not everything is worth reusing."""
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+
+# Similar-project results kept in memory per agent
+SEARCH_MEMO_SIZE = 256
+
+# Extra sub-queries per similar-project search (one per sentence of the idea)
+MAX_QUERY_VARIANTS = 4
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?;]+\s*")
+
+
+def _normalize_idea(idea: str) -> str:
+    """Lowercase and collapse whitespace so trivially different ideas share a cache key"""
+    return " ".join(idea.lower().split())
+
+
+def _query_variants(idea_normalized: str) -> List[str]:
+    """
+    Sentences of a multi-sentence idea, searched alongside the whole idea
+
+    Each sentence usually names one aspect ("tracks meals", "syncs with
+    Garmin"); searching them together and fusing the rankings finds projects
+    that match any one aspect strongly. Single-sentence ideas get none.
+    """
+    sentences = [part for part in _SENTENCE_SPLIT_RE.split(idea_normalized) if len(part.split()) >= 3]
+    if len(sentences) < 2:
+        return []
+    return list(dict.fromkeys(sentences))[:MAX_QUERY_VARIANTS]
+
+
+class ReusabilityScoutAgent(BaseAgent):
+    """Finds reusable components and patterns"""
+
+    USER_TEMPLATE = """Identify reusable components for the project idea above:
+
+PLANNED FEATURES:
+{features}
+{archon_context}
+
+Identify reusable assets following the format.
+Be realistic about what can be reused."""
+
+    def __init__(self, claude_api, max_tokens: int = 800):
+        super().__init__(claude_api, "Reusability Scout", max_tokens)
+        self.archon_rag = get_archon_rag()
+        # In-flight Archon searches by normalized idea (see prefetch_similar)
+        self._pending: Dict[str, asyncio.Future] = {}
+        # In-memory tier in front of search_store (oldest entry evicted first)
+        self._search_memo: Dict[str, tuple] = {}
+
+        # Persist RAG hits across restarts, inside the configured LLM cache directory
+        cache_config = claude_api.config.get("cache", {})
+        self.search_store = LLMCache(
+            directory=str(Path(cache_config.get("directory", "./.cache/llm")) / "archon_rag"),
+            ttl_seconds=cache_config.get("ttl_seconds", 7 * 24 * 3600),
+            enabled=cache_config.get("enabled", True),
+            memory_size=0,  # _search_memo already covers the hot entries
+        )
+
+    async def _search_cached(self, idea_normalized: str) -> tuple:
+        """Query Archon for similar projects, memoized in memory and on disk"""
+        memo = self._search_memo.get(idea_normalized)
+        if memo is not None:
+            return memo
+
+        key = hashlib.sha256(idea_normalized.encode()).hexdigest()
+        stored = self.search_store.get(key)
+        if stored:
+            results = tuple(fast_json.loads(stored))
+        else:
+            results = tuple(await self.archon_rag.search_similar_projects(
+                idea_normalized, variants=_query_variants(idea_normalized)
+            ))
+            if results:
+                self.search_store.set(key, fast_json.dumps(results).decode())
+
+        if len(self._search_memo) >= SEARCH_MEMO_SIZE:
+            self._search_memo.pop(next(iter(self._search_memo)))
+        self._search_memo[idea_normalized] = results
+        return results
+
+    def prefetch_similar(self, idea: str) -> asyncio.Future:
+        """
+        Start the Archon search for an idea in the background
+
+        The search only needs the idea, so the orchestrator starts it before
+        research; run() then awaits the same future instead of searching again.
+        """
+        key = _normalize_idea(idea)
+        future = self._pending.get(key)
+        if future is None:
+            future = self._pending[key] = asyncio.ensure_future(self._search_cached(key))
+        return future
+
+    def get_system_prompt(self) -> str:
+        return SYSTEM_PROMPT
+
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
         """
         Find reusable components
 
         Args:
-            context: Must contain 'idea_description', 'features'
+            context: Needs idea_description, features
 
         Returns:
             Dict with reusable_assets (markdown)
         """
-        idea = context.get('idea_description', '')
-        features = context.get('features', '')
+        idea = context.idea_description
 
         # Try to query Archon RAG if enabled
         similar_projects = []
         if self.archon_rag.is_enabled():
-            similar_projects = self.archon_rag.search_similar_projects(idea)
+            try:
+                similar_projects = list(await self.prefetch_similar(idea))
+            finally:
+                self._pending.pop(_normalize_idea(idea), None)
 
         archon_context = ""
         if similar_projects:
@@ -71,19 +167,9 @@ Focus on realistic reusability - not everything is worth reusing."""
         else:
             archon_context = "\n\nNOTE: No Archon integration available or no similar projects found."
 
-        user_message = f"""Identify reusable components for this project:
-
-PROJECT IDEA:
-{idea}
-
-PLANNED FEATURES:
-{features}
-{archon_context}
-
-Identify reusable assets following the format.
-Be realistic about what can be reused."""
+        user_message = self._create_user_message(context, archon_context=archon_context)
 
-        response = await self.execute(user_message)
+        response = await self.execute(user_message, shared_context=self._shared_context(context))
 
         return {
             "reusable_assets": response,
@@ -0,0 +1,125 @@
+"""
+Structured Output Schemas
+Pydantic models for agents running in structured-output (tool use) mode.
+Each model renders back to the agent's markdown format so downstream
+consumers (spec markdown, Archon publisher) keep working unchanged.
+"""
+from typing import List, Literal
+from pydantic import BaseModel
+
+
+Level = Literal["Low", "Medium", "High"]
+
+
+def _bullets(items: List[str]) -> str:
+    return "\n".join(f"- {item}" for item in items)
+
+
+class Competitor(BaseModel):
+    name: str
+    strengths: str
+    gaps: str
+
+
+class ResearchReport(BaseModel):
+    market_analysis: List[str]
+    competitors: List[Competitor]
+    market_opportunity: List[str]
+    risk_factors: List[str]
+
+    def to_markdown(self) -> str:
+        competitors = "\n".join(
+            f"- **{c.name}**: {c.strengths} (Gaps: {c.gaps})" for c in self.competitors
+        )
+        return (
+            f"## Market Analysis\n{_bullets(self.market_analysis)}\n\n"
+            f"## Competitor Analysis\n{competitors}\n\n"
+            f"## Market Opportunity\n{_bullets(self.market_opportunity)}\n"
+            f"- Risk factors: {'; '.join(self.risk_factors)}\n"
+        )
+
+
+class Feature(BaseModel):
+    name: str
+    priority: Level
+    description: str
+    user_story: str
+    complexity: Level
+    estimated_hours: int
+
+
+class FeaturePlan(BaseModel):
+    features: List[Feature]
+    roadmap: List[str]
+
+    def to_markdown(self) -> str:
+        # Must stay in sync with the _FEATURE_RE in utils/archon_publisher.py
+        sections = [
+            f"### Feature {i}: {f.name}\n"
+            f"- **Priority**: {f.priority}\n"
+            f"- **Description**: {f.description}\n"
+            f"- **User Story**: {f.user_story}\n"
+            f"- **Complexity**: {f.complexity}\n"
+            f"- **Estimated Hours**: {f.estimated_hours} hours\n"
+            for i, f in enumerate(self.features, start=1)
+        ]
+        return (
+            "## MVP Features\n\n" + "\n".join(sections) +
+            f"\n## Feature Roadmap (Post-MVP)\n{_bullets(self.roadmap)}\n"
+        )
+
+
+class TechChoice(BaseModel):
+    name: str
+    reasoning: str
+
+
+class TechStack(BaseModel):
+    backend: TechChoice
+    frontend: TechChoice
+    database: TechChoice
+    deployment: TechChoice
+    testing: str
+    ci_cd: str
+    other_tools: List[str]
+    alternatives: List[str]
+
+    def to_markdown(self) -> str:
+        def choice(header: str, label: str, c: TechChoice) -> str:
+            return f"### {header}\n- **{label}**: {c.name}\n- **Reasoning**: {c.reasoning}\n\n"
+
+        return (
+            "## Recommended Tech Stack\n\n"
+            + choice("Backend", "Framework", self.backend)
+            + choice("Frontend", "Framework", self.frontend)
+            + choice("Database", "Choice", self.database)
+            + choice("Deployment", "Platform", self.deployment)
+            + "### Additional Tools\n"
+            f"- Testing: {self.testing}\n"
+            f"- CI/CD: {self.ci_cd}\n"
+            f"- Other: {', '.join(self.other_tools)}\n\n"
+            f"## Alternative Options\n{_bullets(self.alternatives)}\n"
+        )
+
+
+class ValidationReport(BaseModel):
+    confidence_score: int
+    risk_level: Level
+    completeness: int
+    strengths: List[str]
+    concerns: List[str]
+    recommendations: List[str]
+    missing_elements: List[str]
+
+    def to_markdown(self) -> str:
+        return (
+            "## Validation Report\n\n"
+            "### Overall Assessment\n"
+            f"- **Confidence Score**: {self.confidence_score}/10\n"
+            f"- **Risk Level**: {self.risk_level}\n"
+            f"- **Completeness**: {self.completeness}%\n\n"
+            f"### Strengths ✅\n{_bullets(self.strengths)}\n\n"
+            f"### Concerns ⚠️\n{_bullets(self.concerns)}\n\n"
+            f"### Recommendations\n{_bullets(self.recommendations)}\n\n"
+            f"### Missing Elements\n{_bullets(self.missing_elements)}\n"
+        )
@@ -4,16 +4,11 @@ Recommends optimal technology stack
 """
 from typing import Dict, Any
 from agents.base_agent import BaseAgent
+from agents.context import IdeationContext
+from agents.schemas import TechStack
 
 
-class TechstackAnalyzerAgent(BaseAgent):
-    """Analyzes requirements and recommends tech stack"""
-
-    def __init__(self, claude_api, max_tokens: int = 1000):
-        super().__init__(claude_api, "Techstack Analyzer", max_tokens)
-
-    def get_system_prompt(self) -> str:
-        return """You are a technical architect with expertise in:
+SYSTEM_PROMPT = """You are a technical architect with expertise in:
 - Backend frameworks (FastAPI, Django, Express, etc.)
 - Frontend frameworks (React, Next.js, Vue, etc.)
 - Databases (PostgreSQL, MongoDB, Redis, etc.)
@@ -56,30 +51,38 @@ Brief mention of viable alternatives and trade-offs.
 
 Keep recommendations practical and well-justified."""
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Analyze and recommend tech stack
-
-        Args:
-            context: Must contain 'idea_description', 'features'
-
-        Returns:
-            Dict with techstack (markdown)
-        """
-        idea = context.get('idea_description', '')
-        features = context.get('features', '')
 
-        user_message = f"""Recommend a tech stack for this project:
+class TechstackAnalyzerAgent(BaseAgent):
+    """Analyzes requirements and recommends tech stack"""
 
-PROJECT IDEA:
-{idea}
+    OUTPUT_SCHEMA = TechStack
+    USER_TEMPLATE = """Recommend a tech stack for the project idea above:
 
 PLANNED FEATURES:
 {features}
 
 Provide tech stack recommendations following the format."""
 
-        response = await self.execute(user_message)
+    def __init__(self, claude_api, max_tokens: int = 1000):
+        super().__init__(claude_api, "Techstack Analyzer", max_tokens)
+
+    def get_system_prompt(self) -> str:
+        return SYSTEM_PROMPT
+
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
+        """
+        Analyze and recommend tech stack
+
+        Args:
+            context: Needs idea_description, features
+
+        Returns:
+            Dict with techstack (markdown)
+        """
+        response = await self.execute(
+            self._create_user_message(context),
+            shared_context=self._shared_context(context)
+        )
 
         return {
             "techstack": response,
@@ -4,16 +4,11 @@ Validates project specification for completeness and realism
 """
 from typing import Dict, Any
 from agents.base_agent import BaseAgent
+from agents.context import IdeationContext
+from agents.schemas import ValidationReport
 
 
-class ValidatorAgent(BaseAgent):
-    """Validates project specs and provides quality assessment"""
-
-    def __init__(self, claude_api, max_tokens: int = 1500):
-        super().__init__(claude_api, "Validator", max_tokens)
-
-    def get_system_prompt(self) -> str:
-        return """You are a project validation specialist.
+SYSTEM_PROMPT = """You are a project validation specialist.
 
 Your task: Review a project specification and assess its quality, completeness, and realism.
 
@@ -52,35 +47,56 @@ OUTPUT FORMAT (Markdown):
 
 Be constructive but honest. Flag real issues."""
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Validate project specification
 
-        Args:
-            context: Complete project context (all previous outputs)
-
-        Returns:
-            Dict with validation_report (markdown)
-        """
-        spec_summary = f"""
-IDEA: {context.get('idea_description', '')}
+class ValidatorAgent(BaseAgent):
+    """Validates project specs and provides quality assessment"""
 
-RESEARCH: {context.get('research_report', '')[:500]}...
+    OUTPUT_SCHEMA = ValidationReport
+    # Idea and research arrive in full via the shared context. The remaining
+    # sections are sent whole too: the block is prompt-cached, so truncating
+    # them no longer saves meaningful cost and only hid details from review.
+    USER_TEMPLATE = """Validate the specification for the project idea above:
 
-FEATURES: {context.get('features', '')[:500]}...
+FEATURES:
+{features}
 
-TECHSTACK: {context.get('techstack', '')[:500]}...
+TECHSTACK:
+{techstack}
 
-REUSABILITY: {context.get('reusable_assets', '')[:500]}...
+REUSABILITY:
+{reusable_assets}
 """
 
-        user_message = f"""Validate this project specification:
+    def __init__(self, claude_api, max_tokens: int = 1500):
+        super().__init__(claude_api, "Validator", max_tokens)
+
+    def get_system_prompt(self) -> str:
+        return SYSTEM_PROMPT
 
-{spec_summary}
+    async def run(self, context: IdeationContext) -> Dict[str, Any]:
+        """
+        Validate project specification
 
-Provide a thorough validation report following the format."""
+        Args:
+            context: Complete project context (all previous outputs)
 
-        response = await self.execute(user_message)
+        Returns:
+            Dict with validation_report (markdown)
+        """
+        # The spec summary repeats verbatim across validation retries, so mark it cacheable
+        user_message = [
+            {
+                "type": "text",
+                "text": self._create_user_message(context),
+                "cache_control": {"type": "ephemeral"}
+            },
+            {
+                "type": "text",
+                "text": "Provide a thorough validation report following the format."
+            }
+        ]
+
+        response = await self.execute(user_message, shared_context=self._shared_context(context))
 
         return {
             "validation_report": response,
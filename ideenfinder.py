@@ -4,32 +4,34 @@ Ideenfinder CLI
 Main entry point for the agent factory workflow
 """
 import asyncio
+import contextlib
 import sys
 from pathlib import Path
+from typing import Optional
 import typer
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from dotenv import load_dotenv
-import yaml
-import requests
-import json
 
-# Load environment variables from .env file
-load_dotenv()
+from utils.config_loader import load_config_file
 
-from orchestrator import IdeenfinderOrchestrator
-from utils.archon_publisher import publish_to_archon as intelligent_publish, extract_project_id
+# Heavier modules (orchestrator/anthropic, httpx, yaml, rich prompts) are imported
+# inside the commands that need them, so `version`/`init` start instantly.
 
 app = typer.Typer(help="Ideenfinder - From Idea to Plan using Agent Factory")
 console = Console()
 
 
+@app.callback()
+def main():
+    """Ideenfinder - From Idea to Plan using Agent Factory"""
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 def load_config():
-    """Loads configuration from config.yaml."""
+    """Loads configuration from config.yaml (re-parsed only when the file changes)."""
     try:
-        with open("config.yaml", "r") as f:
-            return yaml.safe_load(f)
+        return load_config_file("config.yaml")
     except FileNotFoundError:
         console.print("[red]❌ config.yaml not found![/red]")
         console.print("Run [cyan]ideenfinder init[/cyan] to create it.")
@@ -37,7 +39,7 @@ def load_config():
 
 def check_setup():
     """Check if setup is complete"""
-    if not Path("config.yaml").exists():
+    if not (Path("config.yaml").exists() or Path("config.toml").exists()):
         console.print("[red]❌ config.yaml not found![/red]")
         console.print("\n[yellow]Setup required:[/yellow]")
         console.print("  1. Copy [cyan]config.yaml.example[/cyan] to [cyan]config.yaml[/cyan]")
@@ -64,6 +66,8 @@ def start(
     )
 ):
     """Start the ideenfinder workflow"""
+    from rich.prompt import Prompt, Confirm
+    from rich.panel import Panel
 
     if not check_setup():
         return
@@ -93,6 +97,7 @@ def start(
         return
 
     # Run orchestrator
+    from orchestrator import IdeenfinderOrchestrator
     try:
         orchestrator = IdeenfinderOrchestrator()
         result = asyncio.run(orchestrator.run_ideation(idea, output))
@@ -112,8 +117,30 @@ def start(
         sys.exit(1)
 
 
+async def _publish(project_spec_path: Path, api_url: str, api_key: str, max_concurrent_writes: int = 8) -> dict:
+    """Run the intelligent publisher over one pooled HTTP/2 client"""
+    import httpx
+    from utils.archon_publisher import publish_to_archon as intelligent_publish
+
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=10),
+        timeout=30.0
+    ) as client:
+        return await intelligent_publish(
+            project_spec_path=project_spec_path,
+            archon_url=api_url,
+            archon_api_key=api_key,
+            client=client,
+            max_concurrent_writes=max_concurrent_writes
+        )
+
+
 def publish_to_archon(plan_file: Path):
     """Reads a project plan and all associated markdown files, then sends them to the Archon API."""
+    import httpx
+    from utils.archon_publisher import extract_project_id
+
     console.print(f"🚀 Publishing project '[cyan]{plan_file}[/cyan]' to Archon with full intelligence...")
 
     # 1. Load configuration
@@ -145,11 +172,9 @@ def publish_to_archon(plan_file: Path):
     # 3. Use intelligent publisher
     try:
         console.print(f"[dim]Using intelligent publisher with project spec: {project_spec_path.name}[/dim]")
-        response_data = intelligent_publish(
-            project_spec_path=project_spec_path,
-            archon_url=api_url,
-            archon_api_key=api_key
-        )
+        response_data = asyncio.run(_publish(
+            project_spec_path, api_url, api_key, archon_config.get("max_concurrent_writes", 8)
+        ))
 
         project_id = extract_project_id(response_data)
         tasks_created = response_data.get("tasks_created", 0)
@@ -162,11 +187,11 @@ def publish_to_archon(plan_file: Path):
         if tasks_created > 0:
             console.print(f"   [green]✓ {tasks_created} tasks created from MVP features[/green]")
 
-    except requests.exceptions.HTTPError as e:
-        console.print(f"\n[bold red]❌ API Error: {e.response.status_code} {e.response.reason}[/bold red]")
+    except httpx.HTTPStatusError as e:
+        console.print(f"\n[bold red]❌ API Error: {e.response.status_code} {e.response.reason_phrase}[/bold red]")
         console.print(f"   [dim]URL: {e.request.url}[/dim]")
         console.print(f"   [dim]Response: {e.response.text}[/dim]")
-    except requests.exceptions.RequestException as e:
+    except httpx.RequestError as e:
         console.print(f"\n[bold red]❌ Connection Error:[/bold red] {e}")
     except Exception as e:
         console.print(f"\n[bold red]❌ An unexpected error occurred:[/bold red] {e}")
@@ -189,9 +214,71 @@ def publish(
     publish_to_archon(plan_file)
 
 
+@app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8765, "--port", "-p", help="Port to listen on")
+):
+    """Run a local HTTP server that keeps config, clients and caches warm"""
+    if not check_setup():
+        return
+
+    try:
+        import uvicorn
+        from fastapi import FastAPI, HTTPException
+        from pydantic import BaseModel
+    except ImportError:
+        console.print("[red]❌ serve requires fastapi and uvicorn.[/red] Run: [cyan]pip install fastapi uvicorn[/cyan]")
+        sys.exit(1)
+
+    from orchestrator import IdeenfinderOrchestrator
+
+    # Everything expensive is loaded once and reused across requests
+    orchestrator = IdeenfinderOrchestrator()
+    if orchestrator.claude_api.config.get("semantic_cache", {}).get("enabled"):
+        from utils.embeddings import get_embedder
+        get_embedder()
+
+    # The orchestrator keeps per-run context, so ideation requests run one at a time
+    run_lock = asyncio.Lock()
+
+    class IdeaRequest(BaseModel):
+        idea: str
+        output_dir: Optional[str] = None
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app):
+        # Connect to the provider while the server waits for its first request
+        warmup = asyncio.create_task(orchestrator.awarmup())
+        yield
+        warmup.cancel()
+
+    api = FastAPI(title="Ideenfinder", lifespan=lifespan)
+
+    # Clients may only pick a directory under ./outputs
+    outputs_root = Path("./outputs").resolve()
+
+    @api.post("/ideate")
+    async def ideate(request: IdeaRequest):
+        output_dir = None
+        if request.output_dir:
+            resolved = (outputs_root / request.output_dir).resolve()
+            if not resolved.is_relative_to(outputs_root):
+                raise HTTPException(status_code=400, detail="output_dir must be inside ./outputs")
+            output_dir = str(resolved)
+        async with run_lock:
+            return await orchestrator.run_ideation(request.idea, output_dir)
+
+    console.print(f"[bold cyan]🚀 Ideenfinder server[/bold cyan] listening on [cyan]http://{host}:{port}[/cyan]")
+    console.print("[dim]POST /ideate {\"idea\": \"...\"}[/dim]\n")
+    uvicorn.run(api, host=host, port=port)
+
+
 @app.command()
 def init():
     """Initialize configuration files"""
+    from rich.prompt import Confirm
+
     console.print("[bold]Initializing Ideenfinder...[/bold]\n")
 
     # Check if config exists
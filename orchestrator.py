@@ -3,22 +3,99 @@ Ideenfinder Orchestrator
 Coordinates all agents through the 5-phase workflow
 """
 import asyncio
-import json
+import importlib
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
-from rich.console import Console
+from typing import Dict, Any, Callable, Optional
+from contextlib import contextmanager
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.live import Live
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from utils import fast_json
 from utils.claude_api import get_claude_api
+from utils.llm_cache import get_llm_cache
 from utils.parallel_executor import run_agents_parallel
 from utils.archon_integration import ArchonIntegration
-from agents.research_agent import ResearchAgent
-from agents.feature_planner import FeaturePlannerAgent
-from agents.techstack_analyzer import TechstackAnalyzerAgent
-from agents.reusability_scout import ReusabilityScoutAgent
-from agents.validator_agent import ValidatorAgent
+from utils.spec_markdown import render_spec_markdown
+from agents.base_agent import BaseAgent, build_shared_context
+from agents.context import IdeationContext
+
+# Agents are imported and built on first use: name -> (module, class)
+AGENT_CLASSES = {
+    "research": ("agents.research_agent", "ResearchAgent"),
+    "features": ("agents.feature_planner", "FeaturePlannerAgent"),
+    "techstack": ("agents.techstack_analyzer", "TechstackAnalyzerAgent"),
+    "reusability": ("agents.reusability_scout", "ReusabilityScoutAgent"),
+    "validator": ("agents.validator_agent", "ValidatorAgent"),
+}
+
+
+REPORT_SECTIONS = [
+    ("Market Research", "research", "report"),
+    ("Features", "features", "plan"),
+    ("Technology Stack", "techstack", "recommendations"),
+    ("Reusable Assets", "reusability", "assets"),
+    ("Validation Report", "validation", "report"),
+]
+
+NEXT_STEPS_MD = """## Next Steps
+
+1. **Review this specification** - Ensure it matches your vision
+2. **Import to Archon** - Use `archon-import.json` for project setup
+3. **Start Development** - Use Claude Code to implement features
+4. **Iterate** - Adjust based on learnings
+
+---
+
+*Generated by Ideenfinder Agent Factory*
+"""
+
+
+async def _write_rendered(path: str, render: Callable[[], bytes]) -> None:
+    """Render and write a file in a worker thread, keeping CPU and disk work off the event loop"""
+    await asyncio.to_thread(lambda: Path(path).write_bytes(render()))
+
+
+class _StreamTail:
+    """Renders the last lines of a streamed agent response (rendered lazily on refresh)"""
+
+    def __init__(self, title: str, lines: int = 15):
+        self.title = title
+        self.lines = lines
+        self.chunks = []
+
+    def __rich__(self) -> Panel:
+        tail = "\n".join("".join(self.chunks).splitlines()[-self.lines:])
+        return Panel(tail or "[dim]Waiting for response...[/dim]", title=self.title, style="green")
+
+
+class _RunDisplay:
+    """One live renderable for a whole run: agent spinners plus an optional stream tail"""
+
+    def __init__(self, console: Console):
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold green]{task.description}"),
+            console=console
+        )
+        self.tail: Optional[_StreamTail] = None
+
+    def __rich__(self):
+        if self.tail is None:
+            return self.progress
+        return Group(self.tail, self.progress)
+
+    @contextmanager
+    def running(self, description: str):
+        """Show a spinner row while the block runs"""
+        task_id = self.progress.add_task(description, total=None)
+        try:
+            yield
+        finally:
+            self.progress.remove_task(task_id)
 
 
 class IdeenfinderOrchestrator:
@@ -28,19 +105,31 @@ class IdeenfinderOrchestrator:
         self.console = Console()
         self.config_path = config_path
         self.claude_api = get_claude_api(config_path)
+        self.llm_cache = get_llm_cache(self.claude_api.config)
 
-        # Initialize agents
-        self.research_agent = ResearchAgent(self.claude_api)
-        self.feature_planner = FeaturePlannerAgent(self.claude_api)
-        self.techstack_analyzer = TechstackAnalyzerAgent(self.claude_api)
-        self.reusability_scout = ReusabilityScoutAgent(self.claude_api)
-        self.validator = ValidatorAgent(self.claude_api)
+        # Agents are created lazily by _agent()
+        self._agents: Dict[str, BaseAgent] = {}
 
         # Initialize Archon integration
         self.archon = ArchonIntegration(config_path)
 
-        # Storage for results
-        self.context = {}
+        # Storage for results (created per run)
+        self.context: Optional[IdeationContext] = None
+        # Live display shared by all phases (created per run)
+        self._display: Optional[_RunDisplay] = None
+
+    def _agent(self, name: str) -> BaseAgent:
+        """Return the named agent, importing and creating it on first use"""
+        agent = self._agents.get(name)
+        if agent is None:
+            module_name, class_name = AGENT_CLASSES[name]
+            agent_class = getattr(importlib.import_module(module_name), class_name)
+            agent = self._agents[name] = agent_class(self.claude_api)
+        return agent
+
+    async def awarmup(self) -> None:
+        """Pre-connect the provider client (for long-lived event loops such as `serve`)"""
+        await self.claude_api.awarmup()
 
     async def run_ideation(
         self,
@@ -65,20 +154,40 @@ class IdeenfinderOrchestrator:
             output_dir = f"./outputs/{timestamp}"
 
         Path(output_dir).mkdir(parents=True, exist_ok=True)
-        self.context['output_dir'] = output_dir
-
+        # Fresh context per run - the orchestrator may be reused (e.g. `ideenfinder serve`)
+        self.context = IdeationContext(idea_description=idea_input, output_dir=output_dir)
+
+        # A single Live renderer for every phase instead of one status/progress per phase
+        self._display = _RunDisplay(self.console)
+        try:
+            with Live(self._display, console=self.console, refresh_per_second=8, transient=True):
+                result = await self._run_workflow(idea_input, output_dir)
+        finally:
+            # Pooled clients are bound to this event loop; they reopen on the next run
+            if "reusability" in self._agents:
+                await self._agents["reusability"].archon_rag.aclose()
+
+        self._display_summary(result["outputs"], output_dir, result["archon_project_id"])
+        return result
+
+    async def _run_workflow(self, idea_input: str, output_dir: str) -> Dict[str, Any]:
+        """Phases 0-5 (runs inside the live display)"""
         # Phase 0: Process idea input
         self.console.print(Panel("[bold]Phase 0: Processing Idea Input[/bold]", style="cyan"))
-        self.context['idea_description'] = idea_input
         self.console.print(f"✓ Idea captured: {idea_input[:100]}...\n")
 
+        # The Archon similar-project search only needs the idea - overlap it with research
+        reusability_scout = self._agent("reusability")
+        if reusability_scout.archon_rag.is_enabled():
+            reusability_scout.prefetch_similar(idea_input)
+
         # Phase 1: Research
         self.console.print(Panel("[bold]Phase 1: Market Research[/bold]", style="cyan"))
         research_result = await self._run_phase_1()
         self.console.print("✓ Research completed\n")
 
         # Phase 2: Parallel Planning
-        self.console.print(Panel("[bold]Phase 2: Parallel Planning (3 agents)[/bold]", style="cyan"))
+        self.console.print(Panel("[bold]Phase 2: Planning (Feature Planner → 2 parallel agents)[/bold]", style="cyan"))
         planning_results = await self._run_phase_2()
         self.console.print("✓ Planning completed\n")
 
@@ -94,22 +203,27 @@ class IdeenfinderOrchestrator:
 
         # Phase 5: Output Generation
         self.console.print(Panel("[bold]Phase 5: Generating Outputs[/bold]", style="cyan"))
-        outputs = self._generate_outputs(spec, output_dir)
-        self.console.print("✓ Outputs generated\n")
+        # File writes run in the background, overlapping the Archon network calls below
+        outputs_task = asyncio.create_task(self._generate_outputs(spec, output_dir))
 
         # Phase 5.5: Auto-Import to Archon (if enabled)
         project_id = None
         if self.archon.enabled:
             self.console.print(Panel("[bold]Auto-Import to Archon[/bold]", style="cyan"))
-            project_id = await self.archon.auto_import_project(spec)
+            try:
+                with self._display.running("Importing to Archon..."):
+                    project_id = await self.archon.auto_import_project(spec)
+            finally:
+                await self.archon.aclose()
             if project_id:
                 self.console.print(f"✨ Project auto-imported to Archon: [cyan]{project_id}[/cyan]")
-                archon_url = self.archon.api_url.replace('/api/projects', '')
+                archon_url = self.archon.base_url
                 self.console.print(f"🔗 Open: [link={archon_url}/projects/{project_id}]{archon_url}/projects/{project_id}[/link]\n")
             else:
                 self.console.print("⚠️  Auto-import failed - check logs above\n")
 
-        self._display_summary(outputs, output_dir, project_id)
+        outputs = await outputs_task
+        self.console.print("✓ Outputs generated\n")
 
         return {
             "specification": spec,
@@ -120,35 +234,54 @@ class IdeenfinderOrchestrator:
 
     async def _run_phase_1(self) -> Dict[str, Any]:
         """Phase 1: Research Agent"""
-        with self.console.status("[bold green]Running Research Agent...") as status:
-            result = await self.research_agent.run(self.context)
-            self.context.update(result)
-            return result
+        tail = self._display.tail = _StreamTail("Research Agent")
+        research_agent = self._agent("research")
+        research_agent.stream_callback = tail.chunks.append
+        try:
+            with self._display.running("Running Research Agent..."):
+                result = await research_agent.run(self.context)
+        finally:
+            research_agent.stream_callback = None
+            self._display.tail = None
+
+        self.context = self.context.merge(result)
+        # Built once so every downstream agent sends a byte-identical, cacheable prefix
+        self.context = replace(self.context, shared_context=build_shared_context(
+            self.context.idea_description,
+            self.context.research_report
+        ))
+        return result
 
     async def _run_phase_2(self) -> Dict[str, Any]:
-        """Phase 2: Parallel Planning Agents"""
-        # Define agents to run in parallel
+        """Phase 2: Feature planning, then parallel Techstack/Reusability agents"""
+        # Techstack and Reusability both consume the feature plan, so it runs first
+        with self._display.running("Running Feature Planner..."):
+            features_result = await self._agent("features").run(self.context)
+            self.context = self.context.merge(features_result)
+
+        # Both remaining agents only depend on (idea, features) - run them in parallel on one snapshot
+        context = self.context
+        techstack, reusability = self._agent("techstack"), self._agent("reusability")
         agents = [
-            ("Feature Planner", lambda: self.feature_planner.run(self.context)),
-            ("Techstack Analyzer", lambda: self.techstack_analyzer.run(self.context)),
-            ("Reusability Scout", lambda: self.reusability_scout.run(self.context))
+            ("Techstack Analyzer", lambda: techstack.run(context)),
+            ("Reusability Scout", lambda: reusability.run(context))
         ]
 
         # Run in parallel with progress
-        results = await run_agents_parallel(agents, show_progress=True)
+        results = await run_agents_parallel(agents, progress=self._display.progress)
 
         # Update context with all results
         for agent_name, result in results.items():
-            self.context.update(result)
+            self.context = self.context.merge(result)
 
-        return results
+        return {"Feature Planner": features_result, **results}
 
     async def _run_phase_4(self) -> Dict[str, Any]:
         """Phase 4: Validator"""
-        with self.console.status("[bold green]Running Validator...") as status:
-            result = await self.validator.run(self.context)
-            self.context.update(result)
-            return result
+        with self._display.running("Running Validator..."):
+            result = await self._agent("validator").run(self.context)
+        self.context = self.context.merge(result)
+        return result
 
     def _generate_specification(self) -> Dict[str, Any]:
         """Phase 3: Generate consolidated specification"""
@@ -157,110 +290,56 @@ class IdeenfinderOrchestrator:
             "generated_at": datetime.now().isoformat(),
             "project": {
                 "title": self._extract_title(),
-                "description": self.context['idea_description'],
+                "description": self.context.idea_description,
                 "type": "web-app",  # Could be enhanced
             },
             "research": {
-                "report": self.context.get('research_report', '')
+                "report": self.context.research_report
             },
             "features": {
-                "plan": self.context.get('features', '')
+                "plan": self.context.features,
+                "items": list(self.context.feature_items)
             },
             "techstack": {
-                "recommendations": self.context.get('techstack', '')
+                "recommendations": self.context.techstack
             },
             "reusability": {
-                "assets": self.context.get('reusable_assets', ''),
-                "similar_projects": self.context.get('similar_projects', [])
+                "assets": self.context.reusable_assets,
+                "similar_projects": list(self.context.similar_projects)
             },
             "validation": {
-                "report": self.context.get('validation_report', '')
+                "report": self.context.validation_report
             }
         }
 
-        self.context['specification'] = spec
+        self.context = replace(self.context, specification=spec)
         return spec
 
-    def _generate_outputs(self, spec: Dict[str, Any], output_dir: str) -> Dict[str, str]:
-        """Phase 5: Generate output files"""
-        outputs = {}
-
-        # 1. Full JSON specification
-        json_path = f"{output_dir}/project-spec.json"
-        with open(json_path, 'w') as f:
-            json.dump(spec, f, indent=2)
-        outputs['json'] = json_path
-
-        # 2. Markdown report
-        md_path = f"{output_dir}/project-spec.md"
-        markdown_content = self._generate_markdown(spec)
-        with open(md_path, 'w') as f:
-            f.write(markdown_content)
-        outputs['markdown'] = md_path
-
-        # 3. Archon import format (simplified for now)
-        archon_path = f"{output_dir}/archon-import.json"
-        archon_data = self._generate_archon_import(spec)
-        with open(archon_path, 'w') as f:
-            json.dump(archon_data, f, indent=2)
-        outputs['archon'] = archon_path
+    async def _generate_outputs(self, spec: Dict[str, Any], output_dir: str) -> Dict[str, str]:
+        """Phase 5: Generate output files (rendered and written concurrently, off the event loop)"""
+        outputs = {
+            # 1. Full JSON specification
+            'json': f"{output_dir}/project-spec.json",
+            # 2. Markdown report
+            'markdown': f"{output_dir}/project-spec.md",
+            # 3. Archon import format (simplified for now)
+            'archon': f"{output_dir}/archon-import.json",
+        }
+
+        await asyncio.gather(
+            _write_rendered(outputs['json'], lambda: fast_json.dumps(spec, indent=True)),
+            _write_rendered(outputs['markdown'], lambda: self._generate_markdown(spec).encode("utf-8")),
+            _write_rendered(
+                outputs['archon'],
+                lambda: fast_json.dumps(self._generate_archon_import(spec), indent=True)
+            ),
+        )
 
         return outputs
 
     def _generate_markdown(self, spec: Dict[str, Any]) -> str:
         """Generate human-readable markdown report"""
-        md = f"""# {spec['project']['title']}
-
-**Generated**: {spec['generated_at']}
-
-## Project Overview
-
-{spec['project']['description']}
-
----
-
-## Market Research
-
-{spec['research']['report']}
-
----
-
-## Features
-
-{spec['features']['plan']}
-
----
-
-## Technology Stack
-
-{spec['techstack']['recommendations']}
-
----
-
-## Reusable Assets
-
-{spec['reusability']['assets']}
-
----
-
-## Validation Report
-
-{spec['validation']['report']}
-
----
-
-## Next Steps
-
-1. **Review this specification** - Ensure it matches your vision
-2. **Import to Archon** - Use `archon-import.json` for project setup
-3. **Start Development** - Use Claude Code to implement features
-4. **Iterate** - Adjust based on learnings
-
----
-
-*Generated by Ideenfinder Agent Factory*
-"""
-        return md
+        return render_spec_markdown(spec, REPORT_SECTIONS, "Project Overview", spaced=True) + NEXT_STEPS_MD
 
     def _generate_archon_import(self, spec: Dict[str, Any]) -> Dict[str, Any]:
         """Generate Archon-compatible import format"""
@@ -287,13 +366,10 @@ class IdeenfinderOrchestrator:
 
     def _extract_title(self) -> str:
         """Extract or generate project title from idea"""
-        idea = self.context['idea_description']
-        # Simple extraction - first sentence or first 50 chars
-        if '.' in idea:
-            title = idea.split('.')[0]
-        else:
-            title = idea[:50]
-        return title.strip()
+        idea = self.context.idea_description
+        # Simple extraction - first sentence or first 50 chars (find + slice: no list of fragments)
+        end = idea.find('.')
+        return (idea[:end] if end >= 0 else idea[:50]).strip()
 
     def _display_summary(self, outputs: Dict[str, str], output_dir: str, project_id: Optional[str] = None):
         """Display completion summary"""
@@ -305,8 +381,12 @@ class IdeenfinderOrchestrator:
 
         self.console.print(f"\n[bold]Output Directory:[/bold] [cyan]{output_dir}[/cyan]")
 
+        cache = self.llm_cache
+        if cache.enabled:
+            self.console.print(f"[dim]LLM cache: {cache.stats['hits']} hits, {cache.stats['misses']} misses[/dim]")
+
         if project_id:
-            archon_url = self.archon.api_url.replace('/api/projects', '')
+            archon_url = self.archon.base_url
             self.console.print(f"\n[bold green]✅ Archon Project:[/bold green] [link={archon_url}/projects/{project_id}]{archon_url}/projects/{project_id}[/link]")
 
         self.console.print("\n[bold yellow]Next Steps:[/bold yellow]")
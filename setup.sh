@@ -6,7 +6,7 @@ echo ""
 
 # Check Python
 if ! command -v python3 &> /dev/null; then
-    echo "❌ Python 3 not found. Please install Python 3.8+"
+    echo "❌ Python 3 not found. Please install Python 3.10+"
     exit 1
 fi
 
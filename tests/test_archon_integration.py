@@ -0,0 +1,65 @@
+"""
+Tests for ArchonIntegration's bulk task creation fallback
+"""
+import unittest
+
+from utils.archon_integration import ArchonIntegration
+
+SPEC = {
+    "project": {"title": "Demo"},
+    "features": {"plan": "1. First feature\n2. Second feature"},
+}
+
+
+def _integration(bulk_reply: tuple) -> tuple:
+    """ArchonIntegration whose :batch POST answers bulk_reply, per-task POSTs succeed"""
+    integration = ArchonIntegration.__new__(ArchonIntegration)
+    integration.projects_url = "http://archon/api/projects"
+    integration._bulk_tasks = None
+    task_posts = []
+
+    async def post(url, payload):
+        if url.endswith(":batch"):
+            return bulk_reply
+        task_posts.append(payload["title"])
+        return 201, {"id": payload["title"]}
+
+    integration._post = post
+    return integration, task_posts
+
+
+class CreateTasksTest(unittest.IsolatedAsyncioTestCase):
+    async def _create(self, integration: ArchonIntegration) -> None:
+        await integration._create_tasks_from_features("p1", SPEC)
+
+    async def test_non_batch_success_body_falls_back(self):
+        for body in (None, "ok", {"status": "queued"}):
+            with self.subTest(body=body):
+                integration, task_posts = _integration((200, body))
+                await self._create(integration)
+                self.assertEqual(sorted(task_posts), ["First feature", "Second feature"])
+                self.assertIsNone(integration._bulk_tasks)
+
+    async def test_missing_endpoint_is_remembered(self):
+        for status in (404, 405):
+            with self.subTest(status=status):
+                integration, task_posts = _integration((status, "not found"))
+                await self._create(integration)
+                self.assertEqual(len(task_posts), 2)
+                self.assertIs(integration._bulk_tasks, False)
+
+    async def test_server_error_falls_back_without_caching(self):
+        integration, task_posts = _integration((503, "unavailable"))
+        await self._create(integration)
+        self.assertEqual(len(task_posts), 2)
+        self.assertIsNone(integration._bulk_tasks)
+
+    async def test_bulk_success(self):
+        integration, task_posts = _integration((201, {"tasks": [{"id": "a"}, {"id": "b"}]}))
+        await self._create(integration)
+        self.assertEqual(task_posts, [])
+        self.assertIs(integration._bulk_tasks, True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the Archon publisher's batch-probe fallback
+"""
+import asyncio
+import json
+import unittest
+
+import httpx
+
+from utils import archon_publisher
+
+
+def _client(batch_status: int, batch_body: bytes = b"{}") -> tuple:
+    """Mock Archon: the :batch endpoint answers batch_status, per-item POSTs succeed"""
+    item_posts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(":batch"):
+            return httpx.Response(batch_status, content=batch_body)
+        payload = json.loads(request.content)
+        item_posts.append(payload["title"])
+        return httpx.Response(201, json={"id": payload["title"]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), item_posts
+
+
+class PostAllTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        archon_publisher._NO_BATCH.clear()
+        self._delay = archon_publisher.RETRY_BASE_DELAY
+        archon_publisher.RETRY_BASE_DELAY = 0
+
+    def tearDown(self):
+        archon_publisher.RETRY_BASE_DELAY = self._delay
+        archon_publisher._NO_BATCH.clear()
+
+    async def _post_all(self, client: httpx.AsyncClient) -> list:
+        payloads = [{"title": "a"}, {"title": "b"}]
+        async with client:
+            return await archon_publisher._post_all(
+                client, "http://archon/api/tasks", {}, payloads, "task", asyncio.Semaphore(4)
+            )
+
+    async def test_failed_probe_falls_back_to_item_posts(self):
+        for status in (401, 422, 500):
+            with self.subTest(status=status):
+                client, item_posts = _client(status)
+                created = await self._post_all(client)
+                self.assertEqual([c["id"] for c in created], ["a", "b"])
+                self.assertEqual(sorted(item_posts), ["a", "b"])
+                # Only a missing endpoint is remembered
+                self.assertEqual(archon_publisher._NO_BATCH, set())
+
+    async def test_missing_endpoint_is_remembered(self):
+        client, item_posts = _client(404)
+        await self._post_all(client)
+        self.assertEqual(sorted(item_posts), ["a", "b"])
+        self.assertEqual(archon_publisher._NO_BATCH, {("archon", "task")})
+
+    async def test_non_batch_success_body_falls_back(self):
+        for body in (b"ok", b'{"status": "queued"}'):
+            with self.subTest(body=body):
+                client, item_posts = _client(200, body)
+                created = await self._post_all(client)
+                self.assertEqual(len(created), 2)
+                self.assertEqual(sorted(item_posts), ["a", "b"])
+
+    async def test_batch_success(self):
+        client, item_posts = _client(201, b'{"tasks": [{"id": "a"}, {"id": "b"}]}')
+        created = await self._post_all(client)
+        self.assertEqual(created, [{"id": "a"}, {"id": "b"}])
+        self.assertEqual(item_posts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests for BaseAgent's hedged requests and response caching
+"""
+import asyncio
+import gc
+import unittest
+from types import SimpleNamespace
+
+from agents.base_agent import BaseAgent
+from utils.llm_cache import LLMCache
+
+
+def _calls(outcomes, release: asyncio.Event):
+    """Build call() returning the given outcomes in order, all finishing once release is set"""
+    remaining = list(outcomes)
+
+    async def call():
+        outcome = remaining.pop(0)
+        await release.wait()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call
+
+
+class HedgedTest(unittest.IsolatedAsyncioTestCase):
+    async def _run(self, outcomes):
+        release = asyncio.Event()
+        agent = SimpleNamespace(hedge_after=0.01)
+        hedged = asyncio.ensure_future(BaseAgent._hedged(agent, _calls(outcomes, release)))
+        # Let the hedge fire, then finish both requests in the same loop iteration
+        await asyncio.sleep(0.05)
+        release.set()
+        return await hedged
+
+    async def test_success_wins_when_both_finish_together(self):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: errors.append(ctx))
+
+        for outcomes in ([RuntimeError("first"), "ok"], ["ok", RuntimeError("second")]):
+            with self.subTest(outcomes=outcomes):
+                self.assertEqual(await self._run(outcomes), "ok")
+
+        gc.collect()
+        await asyncio.sleep(0)
+        self.assertEqual(errors, [])
+
+    async def test_raises_when_both_fail(self):
+        with self.assertRaises(RuntimeError):
+            await self._run([RuntimeError("first"), RuntimeError("second")])
+
+    async def test_fast_first_request_is_not_hedged(self):
+        agent = SimpleNamespace(hedge_after=1.0)
+        started = []
+
+        async def call():
+            started.append(1)
+            return "ok"
+
+        self.assertEqual(await BaseAgent._hedged(agent, call), "ok")
+        self.assertEqual(len(started), 1)
+
+
+class _Agent(BaseAgent):
+    def get_system_prompt(self) -> str:
+        return "system"
+
+    async def run(self, context):
+        return {}
+
+
+class _SemanticCache:
+    """Records every lookup/store; always has an answer ready"""
+
+    enabled = True
+
+    def __init__(self):
+        self.calls = []
+
+    async def aget(self, user_message):
+        self.calls.append("aget")
+        return "semantic hit"
+
+    async def aset(self, user_message, response):
+        self.calls.append("aset")
+
+
+def _agent(temperature: float) -> _Agent:
+    async def astream_message(**kwargs):
+        yield "fresh"
+
+    claude = SimpleNamespace(config={"cache": {"enabled": False}}, model="m", astream_message=astream_message)
+    agent = _Agent(claude, "Research Agent", temperature=temperature)
+    agent.cache = LLMCache(enabled=False)
+    agent.semantic_cache = _SemanticCache()
+    return agent
+
+
+class SemanticCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_sampled_agent_never_touches_semantic_cache(self):
+        agent = _agent(temperature=0.5)
+        self.assertEqual(await agent.execute("idea"), "fresh")
+        self.assertEqual(agent.semantic_cache.calls, [])
+
+    async def test_deterministic_agent_uses_semantic_cache(self):
+        agent = _agent(temperature=0.0)
+        self.assertEqual(await agent.execute("idea"), "semantic hit")
+        self.assertEqual(agent.semantic_cache.calls, ["aget"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for run_agents_parallel's handling of agent callables
+"""
+import asyncio
+import threading
+import unittest
+
+from utils.parallel_executor import blocking, run_agents_parallel
+
+
+class RunAgentsParallelTest(unittest.IsolatedAsyncioTestCase):
+    async def _run(self, agents, **kwargs) -> dict:
+        return await run_agents_parallel(agents, show_progress=False, **kwargs)
+
+    async def test_coroutine_lambda_runs_on_the_loop(self):
+        loop_thread = threading.get_ident()
+        called_in = []
+
+        async def agent():
+            return "done"
+
+        def build():
+            called_in.append(threading.get_ident())
+            asyncio.get_running_loop()  # Raises outside the loop thread
+            return agent()
+
+        results = await self._run([("Agent", lambda: build())])
+        self.assertEqual(results, {"Agent": "done"})
+        self.assertEqual(called_in, [loop_thread])
+
+    async def test_blocking_callable_runs_in_a_worker_thread(self):
+        loop_thread = threading.get_ident()
+        results = await self._run([("Agent", blocking(threading.get_ident))])
+        self.assertNotEqual(results["Agent"], loop_thread)
+
+    async def test_async_generator_is_streamed(self):
+        async def agent():
+            yield "a"
+            yield "b"
+
+        chunks = []
+        results = await self._run([("Agent", agent)], on_chunk=lambda name, chunk: chunks.append(chunk))
+        self.assertEqual(results, {"Agent": "ab"})
+        self.assertEqual(chunks, ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,46 @@
 """
 Archon Integration - Auto-Import Projects
 """
-import aiohttp
-import yaml
-from typing import Dict, Any, Optional
+import asyncio
+import re
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
+from utils import fast_json
+from utils.config_loader import load_config_file
+from utils.spec_markdown import render_spec_markdown
+
+SPEC_DOC_SECTIONS = [
+    ("Market Research", "research", "report"),
+    ("Features", "features", "plan"),
+    ("Tech Stack", "techstack", "recommendations"),
+    ("Reusable Assets", "reusability", "assets"),
+    ("Validation", "validation", "report"),
+]
+
+# Numbered ("1." / "1)") or bulleted ("-" / "*") list item; group 1 is the item text
+_BULLET_RE = re.compile(r'^\s*(?:\d+[.)]\s+|[-*]\s+)(.+?)\s*$')
+
+# Tasks created per import, and how much of the feature plan is scanned for them
+MAX_TASKS = 10
+MAX_SCAN_CHARS = 64 * 1024
+
+if TYPE_CHECKING:  # aiohttp is imported on first request, not at module load
+    import aiohttp
+
+# Transient (429/5xx/connection) write failures are retried with exponential backoff
+WRITE_RETRIES = 3
+RETRY_BASE_DELAY = 0.2
+
+# Enough of an error body to see what went wrong without reading whole HTML error pages
+ERROR_BODY_BYTES = 512
+
+
+async def _error_summary(response: "aiohttp.ClientResponse") -> str:
+    """Status, reason and the start of the body of a failed response"""
+    body = await response.content.read(ERROR_BODY_BYTES)
+    return f"{response.status} {response.reason} - {body.decode('utf-8', 'replace')}"
+
 
 class ArchonIntegration:
     """Client for Archon API integration"""
@@ -13,13 +48,61 @@ class ArchonIntegration:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
         self.api_url = self.config['archon']['api_url']
+        # api_url may or may not include the /api/projects suffix - only strip it at the end
+        suffix = '/api/projects'
+        self.base_url = self.api_url[:-len(suffix)] if self.api_url.endswith(suffix) else self.api_url
+        self.projects_url = f"{self.base_url}{suffix}"
         self.api_key = self.config['archon'].get('api_key')
         self.enabled = self.config['archon'].get('enabled', True)
 
+        # Built once and shared by every request (bodies are pre-encoded JSON)
+        self._default_headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            self._default_headers['apikey'] = self.api_key
+            self._default_headers['Authorization'] = f'Bearer {self.api_key}'
+
+        # One pooled session for all Archon calls (created lazily inside the event loop)
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Whether Archon has a tasks:batch endpoint (None = not probed yet)
+        self._bulk_tasks: Optional[bool] = None
+        # Caps simultaneous writes so a task fan-out doesn't overwhelm Archon
+        self._write_slots = asyncio.Semaphore(self.config['archon'].get('max_concurrent_writes', 8))
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared session, (re)creating it if needed"""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            # Every call hits the same Archon host: cache its DNS and keep sockets warm
+            connector = aiohttp.TCPConnector(
+                limit=32,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._default_headers,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session (a later call opens a new one)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "ArchonIntegration":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file"""
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_config_file(config_path)
 
     async def auto_import_project(self, spec: Dict[str, Any]) -> Optional[str]:
         """
@@ -59,31 +142,47 @@ class ArchonIntegration:
             print("📝 You can manually import using archon-import.json")
             return None
 
+    async def _post(self, url: str, payload: Any) -> Tuple[int, Any]:
+        """
+        POST JSON with bounded concurrency, retrying 429/5xx and connection errors
+
+        Returns:
+            (status, parsed body) on success, (status, error summary) otherwise
+        """
+        import aiohttp
+
+        session = await self._get_session()
+        data = fast_json.dumps(payload)
+
+        for attempt in range(WRITE_RETRIES):
+            last_attempt = attempt == WRITE_RETRIES - 1
+            try:
+                async with self._write_slots:
+                    async with session.post(url, data=data) as response:
+                        if response.status < 300:
+                            body = await response.read()
+                            return response.status, fast_json.loads(body) if body else None
+                        retryable = response.status == 429 or response.status >= 500
+                        if not retryable or last_attempt:
+                            return response.status, await _error_summary(response)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
     async def _create_project(self, project_data: Dict[str, Any]) -> Optional[str]:
         """Create project in Archon"""
-        # Fix API URL - remove /api/projects if present, we'll add it
-        base_url = self.api_url.replace('/api/projects', '')
-        url = f"{base_url}/api/projects"
+        status, data = await self._post(self.projects_url, project_data)
+        if status == 201:
+            return data.get('id')
 
-        headers = {}
-        if self.api_key:
-            headers['apikey'] = self.api_key
-            headers['Authorization'] = f'Bearer {self.api_key}'
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=project_data, headers=headers) as response:
-                if response.status == 201:
-                    data = await response.json()
-                    return data.get('id')
-                else:
-                    error_text = await response.text()
-                    print(f"Failed to create project: {response.status} - {error_text}")
-                    return None
+        print(f"Failed to create project: {data}")
+        return None
 
     async def _create_spec_document(self, project_id: str, spec: Dict[str, Any]) -> None:
         """Create specification document in Archon"""
-        base_url = self.api_url.replace('/api/projects', '')
-        url = f"{base_url}/api/projects/{project_id}/docs"
+        url = f"{self.projects_url}/{project_id}/docs"
 
         # Convert spec to markdown
         content = self._spec_to_markdown(spec)
@@ -94,104 +193,104 @@ class ArchonIntegration:
             "document_type": "spec"
         }
 
-        headers = {}
-        if self.api_key:
-            headers['apikey'] = self.api_key
-            headers['Authorization'] = f'Bearer {self.api_key}'
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=document_data, headers=headers) as response:
-                if response.status != 201:
-                    error_text = await response.text()
-                    print(f"Failed to create document: {response.status} - {error_text}")
+        status, data = await self._post(url, document_data)
+        if status != 201:
+            print(f"Failed to create document: {data}")
 
     async def _create_tasks_from_features(self, project_id: str, spec: Dict[str, Any]) -> None:
         """Extract tasks from features and create them in Archon"""
-        base_url = self.api_url.replace('/api/projects', '')
-        url = f"{base_url}/api/projects/{project_id}/tasks"
+        url = f"{self.projects_url}/{project_id}/tasks"
 
         features_text = spec.get('features', {}).get('plan', '')
 
         # Simple feature extraction (can be enhanced)
         tasks = self._extract_tasks(features_text, spec['project']['title'])
 
-        headers = {}
-        if self.api_key:
-            headers['apikey'] = self.api_key
-            headers['Authorization'] = f'Bearer {self.api_key}'
-
-        async with aiohttp.ClientSession() as session:
-            for task in tasks:
-                task_data = {
-                    "title": task['title'],
-                    "description": task['description'],
-                    "status": "todo"
-                }
-
-                async with session.post(url, json=task_data, headers=headers) as response:
-                    if response.status != 201:
-                        error_text = await response.text()
-                        print(f"Failed to create task '{task['title']}': {response.status}")
+        task_payloads = [
+            {
+                "title": task['title'],
+                "description": task['description'],
+                "status": "todo"
+            }
+            for task in tasks
+        ]
+
+        # One round trip for all tasks when Archon supports it
+        if self._bulk_tasks is not False and await self._create_tasks_bulk(url, task_payloads):
+            return
+
+        # Otherwise tasks are independent - create them concurrently (bounded by _write_slots)
+        results = await asyncio.gather(
+            *(self._create_task(url, task_data) for task_data in task_payloads),
+            return_exceptions=True
+        )
+        for task_data, result in zip(task_payloads, results):
+            if isinstance(result, Exception):
+                print(f"Failed to create task '{task_data['title']}': {result}")
+
+    async def _create_tasks_bulk(self, url: str, task_payloads: List[Dict[str, Any]]) -> bool:
+        """Create all tasks in one request; False (create them one by one) unless it succeeded"""
+        try:
+            status, data = await self._post(f"{url}:batch", {"tasks": task_payloads})
+        except Exception as e:
+            print(f"Bulk task creation failed, creating tasks one by one: {e}")
+            return False
+
+        if status in (404, 405):
+            self._bulk_tasks = False  # Remember, so later imports skip the probe
+            return False
+        if status not in (200, 201):
+            # Not cached - the endpoint exists, this request just failed
+            print(f"Bulk task creation failed ({status}), creating tasks one by one: {data}")
+            return False
+
+        created = data.get("tasks") if isinstance(data, dict) else data
+        if not isinstance(created, list):
+            # 2xx but not a batch response (catch-all route, proxy) - nothing was created
+            print("Bulk task creation returned no task list, creating tasks one by one")
+            return False
+
+        self._bulk_tasks = True
+        return True
+
+    async def _create_task(self, url: str, task_data: Dict[str, Any]) -> None:
+        """Create a single task in Archon"""
+        status, data = await self._post(url, task_data)
+        if status != 201:
+            print(f"Failed to create task '{task_data['title']}': {data}")
 
     def _spec_to_markdown(self, spec: Dict[str, Any]) -> str:
         """Convert specification to markdown format"""
-        md = f"# {spec['project']['title']}\n\n"
-        md += f"**Generated:** {spec['generated_at']}\n\n"
-        md += f"## Description\n{spec['project']['description']}\n\n"
-
-        # Research
-        if 'research' in spec:
-            md += f"## Market Research\n{spec['research'].get('report', '')}\n\n"
-
-        # Features
-        if 'features' in spec:
-            md += f"## Features\n{spec['features'].get('plan', '')}\n\n"
-
-        # Tech Stack
-        if 'techstack' in spec:
-            md += f"## Tech Stack\n{spec['techstack'].get('recommendations', '')}\n\n"
-
-        # Reusability
-        if 'reusability' in spec:
-            md += f"## Reusable Assets\n{spec['reusability'].get('assets', '')}\n\n"
-
-        # Validation
-        if 'validation' in spec:
-            md += f"## Validation\n{spec['validation'].get('report', '')}\n\n"
-
-        return md
+        return render_spec_markdown(spec, SPEC_DOC_SECTIONS)
 
     def _extract_tasks(self, features_text: str, project_title: str) -> list:
         """Extract tasks from features text"""
         tasks = []
 
         # Simple extraction: Look for numbered lists or bullet points
-        lines = features_text.split('\n')
         current_task = None
 
-        for line in lines:
-            line = line.strip()
-
-            # Check for task indicators (numbered or bulleted lists)
-            if line and (line[0].isdigit() or line.startswith('-') or line.startswith('*')):
-                # Extract title (remove numbering/bullets)
-                title = line.lstrip('0123456789.-* ').strip()
-
-                if title and len(title) > 3:  # Avoid empty or too short titles
-                    if current_task:
-                        tasks.append(current_task)
+        for raw in features_text[:MAX_SCAN_CHARS].splitlines():
+            match = _BULLET_RE.match(raw)
+            if match:
+                title = match.group(1)
 
+                if len(title) > 3:  # Avoid too short titles
+                    if len(tasks) == MAX_TASKS:
+                        break  # The last task's description is complete - skip the rest
                     current_task = {
                         "title": title[:100],  # Limit length
-                        "description": ""
+                        "desc_parts": []
                     }
-            elif current_task and line:
-                # Add to description
-                current_task['description'] += line + '\n'
+                    tasks.append(current_task)
+            elif current_task:
+                line = raw.strip()
+                if line:
+                    current_task['desc_parts'].append(line)
 
-        # Add last task
-        if current_task:
-            tasks.append(current_task)
+        # Join description fragments once instead of concatenating per line
+        for task in tasks:
+            task['description'] = '\n'.join(task.pop('desc_parts'))
 
         # If no tasks extracted, create default one
         if not tasks:
@@ -200,4 +299,4 @@ class ArchonIntegration:
                 "description": "Implement the project according to the specification"
             })
 
-        return tasks[:10]  # Limit to 10 tasks
+        return tasks
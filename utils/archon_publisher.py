@@ -2,43 +2,83 @@
 Intelligent Archon Publisher
 Transforms Ideenfinder outputs into complete, structured Archon projects
 """
-import json
+import asyncio
 import re
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any
-import requests
+from typing import Dict, List, Any, Optional, Set, Tuple
+from urllib.parse import urlsplit
+import httpx
+
+from utils import fast_json
+from utils.archon_integration import WRITE_RETRIES, RETRY_BASE_DELAY
+
+# Compiled once; must stay in sync with FeaturePlan.to_markdown in agents/schemas.py
+_FEATURE_RE = re.compile(
+    r'### Feature \d+: (.+?)\n- \*\*Priority\*\*: (.+?)\n- \*\*Description\*\*: (.+?)\n'
+    r'- \*\*User Story\*\*: (.+?)\n- \*\*Complexity\*\*: (.+?)\n- \*\*Estimated Hours\*\*: (\d+) hours',
+    re.DOTALL
+)
+_FEATURE_COUNT_RE = re.compile(r'### Feature \d+:')
+
+# Archon rarely wants more than this many tasks per project
+MAX_PUBLISH_TASKS = 20
+
+# (host, kind) pairs whose Archon server has no ":batch" endpoint - probed once per process
+_NO_BATCH: Set[Tuple[str, str]] = set()
+
+
+def _feature_to_task(
+    title: str,
+    priority: str,
+    description: str,
+    user_story: str,
+    complexity: str,
+    hours: int
+) -> Dict[str, Any]:
+    """Build an Archon task from the fields of one feature"""
+    # Map priority to status
+    status = "todo" if priority.lower() in ["high", "medium"] else "backlog"
+
+    return {
+        "title": title.strip(),
+        "description": f"{description.strip()}\n\n**User Story:** {user_story.strip()}",
+        "status": status,
+        "priority": priority.lower(),
+        "tags": [complexity.lower(), "mvp", "ideenfinder"],
+        "estimated_hours": int(hours),
+        "metadata": {
+            "complexity": complexity.lower(),
+            "user_story": user_story.strip(),
+            "source": "ideenfinder"
+        }
+    }
 
 
 def parse_features_to_tasks(features_plan: str) -> List[Dict[str, Any]]:
     """Parse feature plan text into structured tasks"""
     tasks = []
 
-    # Split by feature headers (### Feature N:)
-    feature_pattern = r'### Feature \d+: (.+?)\n- \*\*Priority\*\*: (.+?)\n- \*\*Description\*\*: (.+?)\n- \*\*User Story\*\*: (.+?)\n- \*\*Complexity\*\*: (.+?)\n- \*\*Estimated Hours\*\*: (\d+) hours'
-
-    matches = re.finditer(feature_pattern, features_plan, re.DOTALL)
+    # Split by feature headers (### Feature N:), stopping once enough tasks are found
+    for match in islice(_FEATURE_RE.finditer(features_plan), MAX_PUBLISH_TASKS):
+        tasks.append(_feature_to_task(*match.groups()))
 
-    for match in matches:
-        title, priority, description, user_story, complexity, hours = match.groups()
-
-        # Map priority to status
-        status = "todo" if priority.lower() in ["high", "medium"] else "backlog"
+    return tasks
 
-        tasks.append({
-            "title": title.strip(),
-            "description": f"{description.strip()}\n\n**User Story:** {user_story.strip()}",
-            "status": status,
-            "priority": priority.lower(),
-            "tags": [complexity.lower(), "mvp", "ideenfinder"],
-            "estimated_hours": int(hours),
-            "metadata": {
-                "complexity": complexity.lower(),
-                "user_story": user_story.strip(),
-                "source": "ideenfinder"
-            }
-        })
 
-    return tasks
+def feature_items_to_tasks(feature_items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build tasks directly from structured feature items (no markdown parsing)"""
+    return [
+        _feature_to_task(
+            item["name"],
+            item["priority"],
+            item["description"],
+            item["user_story"],
+            item["complexity"],
+            item["estimated_hours"],
+        )
+        for item in feature_items[:MAX_PUBLISH_TASKS]
+    ]
 
 
 def create_structured_documents(project_spec: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -125,16 +165,18 @@ def extract_project_metadata(project_spec: Dict[str, Any]) -> Dict[str, Any]:
     # Extract features summary
     if "features" in project_spec:
         features_plan = project_spec["features"].get("plan", "")
-        feature_count = len(re.findall(r'### Feature \d+:', features_plan))
+        feature_count = len(_FEATURE_COUNT_RE.findall(features_plan))
         metadata["mvp_features_count"] = feature_count
 
     return metadata
 
 
-def publish_to_archon(
+async def publish_to_archon(
     project_spec_path: Path,
     archon_url: str,
-    archon_api_key: str = None
+    archon_api_key: str = None,
+    client: Optional[httpx.AsyncClient] = None,
+    max_concurrent_writes: int = 8
 ) -> Dict[str, Any]:
     """
     Publish a complete Ideenfinder project to Archon
@@ -143,22 +185,31 @@ def publish_to_archon(
         project_spec_path: Path to project-spec.json
         archon_url: Archon API URL
         archon_api_key: Optional API key
+        client: Optional shared httpx.AsyncClient; one is created for this call if omitted
+        max_concurrent_writes: Max simultaneous document/task POSTs
 
     Returns:
         Response from Archon API
     """
+    if client is None:
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32),
+            timeout=30.0
+        ) as own_client:
+            return await publish_to_archon(
+                project_spec_path, archon_url, archon_api_key, own_client, max_concurrent_writes
+            )
 
     # 1. Load project specification
-    with open(project_spec_path, 'r', encoding='utf-8') as f:
-        project_spec = json.load(f)
+    project_spec = fast_json.loads(Path(project_spec_path).read_bytes())
 
     # 2. Extract project info
     project_info = project_spec.get("project", {})
     title = project_info.get("title", "Untitled Project")
     description = project_info.get("description", "")
-    project_type = project_info.get("type", "web-app")
 
-    # 3. Create structured documents
+    # 3. Create structured documents (they reference the spec's markdown strings, no copies)
     documents = create_structured_documents(project_spec)
 
     # 4. Add markdown files from same directory
@@ -174,87 +225,197 @@ def publish_to_archon(
 
     # 5. Parse features into tasks
     tasks = []
-    if "features" in project_spec and project_spec["features"].get("plan"):
+    if "features" in project_spec and project_spec["features"].get("items"):
+        tasks = feature_items_to_tasks(project_spec["features"]["items"])
+    elif "features" in project_spec and project_spec["features"].get("plan"):
         tasks = parse_features_to_tasks(project_spec["features"]["plan"])
 
-    # 6. Extract metadata
-    metadata = extract_project_metadata(project_spec)
+    # Everything needed has been pulled out - let the parsed spec go before the network phase
+    del project_spec
 
-    # 7. Build project payload (without documents - they're created separately)
+    # 6. Build project payload (without documents - they're created separately)
     payload = {
         "title": title,
         "description": description
     }
 
-    # 8. Send project to Archon
+    # 7. Send project to Archon
     headers = {"Content-Type": "application/json"}
     if archon_api_key:
         headers["Authorization"] = f"Bearer {archon_api_key}"
 
-    response = requests.post(archon_url, headers=headers, json=payload)
+    response = await client.post(archon_url, headers=headers, content=fast_json.dumps(payload))
     response.raise_for_status()
 
     project_response = response.json()
     project_id = extract_project_id(project_response)
 
-    # 9. Create documents for the project
-    if documents and project_id != "unknown":
-        base_url = archon_url.rsplit('/', 1)[0]  # Remove '/projects'
-        docs_url = f"{base_url}/projects/{project_id}/docs"
-
-        created_docs = []
-        for doc_data in documents:
-            doc_payload = {
-                "document_type": doc_data.get("document_type", "note"),
-                "title": doc_data["title"],
-                "content": doc_data.get("content", {}),
-                "tags": doc_data.get("tags", []),
-                "author": "Ideenfinder"
-            }
-
-            try:
-                doc_response = requests.post(docs_url, headers=headers, json=doc_payload)
-                doc_response.raise_for_status()
-                created_docs.append(doc_response.json())
-            except Exception as e:
-                print(f"Warning: Failed to create document '{doc_data['title']}': {str(e)}")
-
+    if project_id == "unknown":
+        return project_response
+
+    base_url = archon_url.rsplit('/', 1)[0]  # Remove '/projects'
+
+    # 8. Accumulate document payloads for the project
+    docs_url = f"{base_url}/projects/{project_id}/docs"
+    doc_payloads = [
+        {
+            "document_type": doc_data.get("document_type", "note"),
+            "title": doc_data["title"],
+            "content": doc_data.get("content", {}),
+            "tags": doc_data.get("tags", []),
+            "author": "Ideenfinder"
+        }
+        for doc_data in documents
+    ]
+
+    # 9. Accumulate task payloads (with project_id)
+    tasks_url = f"{base_url}/tasks"
+    task_payloads = [
+        {
+            "project_id": project_id,
+            "title": task_data["title"],
+            "description": task_data["description"],
+            "status": task_data["status"],
+            "priority": task_data["priority"],
+            "assignee": "User",
+            "task_order": 0
+        }
+        for task_data in tasks
+    ]
+
+    # 10. Send all documents and tasks concurrently over the shared connection pool
+    write_slots = asyncio.Semaphore(max_concurrent_writes)
+    created_docs, created_tasks = await asyncio.gather(
+        _post_all(client, docs_url, headers, doc_payloads, "document", write_slots),
+        _post_all(client, tasks_url, headers, task_payloads, "task", write_slots),
+    )
+
+    if documents:
         project_response["documents_created"] = len(created_docs)
         project_response["documents"] = created_docs
 
-    # 10. Create tasks if we have any
-    if tasks and project_id != "unknown":
-        base_url = archon_url.rsplit('/', 1)[0]  # Remove '/projects'
-        tasks_url = f"{base_url}/tasks"
-
-        created_tasks = []
-        for task_data in tasks:
-            # Add project_id to task
-            task_payload = {
-                "project_id": project_id,
-                "title": task_data["title"],
-                "description": task_data["description"],
-                "status": task_data["status"],
-                "priority": task_data["priority"],
-                "assignee": "User",
-                "task_order": 0
-            }
-
-            try:
-                task_response = requests.post(tasks_url, headers=headers, json=task_payload)
-                task_response.raise_for_status()
-                created_tasks.append(task_response.json())
-            except Exception as e:
-                # Log error but continue with other tasks
-                print(f"Warning: Failed to create task '{task_data['title']}': {str(e)}")
-
-        # Add tasks to response
+    if tasks:
         project_response["tasks_created"] = len(created_tasks)
         project_response["tasks"] = created_tasks
 
     return project_response
 
 
+def publish_to_archon_sync(
+    project_spec_path: Path,
+    archon_url: str,
+    archon_api_key: str = None,
+    max_concurrent_writes: int = 8
+) -> Dict[str, Any]:
+    """Blocking wrapper around publish_to_archon for callers without an event loop"""
+    return asyncio.run(publish_to_archon(
+        project_spec_path, archon_url, archon_api_key, max_concurrent_writes=max_concurrent_writes
+    ))
+
+
+async def _post_all(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    payloads: List[Dict[str, Any]],
+    kind: str,
+    write_slots: asyncio.Semaphore
+) -> List[Dict[str, Any]]:
+    """POST all payloads (one batch request if supported, else concurrently); failures are logged and skipped"""
+    if not payloads:
+        return []
+
+    created = await _post_batch(client, url, headers, payloads, kind, write_slots)
+    if created is not None:
+        return created
+
+    responses = await asyncio.gather(
+        *(_post_with_retry(client, url, headers, payload, write_slots) for payload in payloads),
+        return_exceptions=True
+    )
+
+    created = []
+    for payload, response in zip(payloads, responses):
+        try:
+            if isinstance(response, Exception):
+                raise response
+            response.raise_for_status()
+            created.append(response.json())
+        except Exception as e:
+            # Log error but continue with the others
+            print(f"Warning: Failed to create {kind} '{payload['title']}': {str(e)}")
+    return created
+
+
+async def _post_batch(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    payloads: List[Dict[str, Any]],
+    kind: str,
+    write_slots: asyncio.Semaphore
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Create all payloads via POST {url}:batch
+
+    Returns None whenever the batch didn't demonstrably succeed, so the
+    caller falls back to per-item POSTs - only 404/405 mark the endpoint
+    as missing for later calls.
+    """
+    probe = (urlsplit(url).netloc, kind)
+    if probe in _NO_BATCH:
+        return None
+
+    plural = f"{kind}s"
+    try:
+        response = await _post_with_retry(client, f"{url}:batch", headers, {plural: payloads}, write_slots)
+    except httpx.HTTPError as e:
+        print(f"Warning: Batch creation of {plural} failed, creating one by one: {str(e)}")
+        return None
+
+    if response.status_code in (404, 405):
+        _NO_BATCH.add(probe)
+        return None
+    if not response.is_success:
+        print(f"Warning: Batch creation of {plural} failed ({response.status_code}), creating one by one")
+        return None
+
+    try:
+        data = response.json()
+    except ValueError:
+        return None
+    created = data.get(plural) if isinstance(data, dict) else data
+    if not isinstance(created, list):
+        # 2xx but not a batch response - treat the endpoint as unsupported
+        return None
+    return created
+
+
+async def _post_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Dict[str, str],
+    payload: Any,
+    write_slots: asyncio.Semaphore
+) -> httpx.Response:
+    """POST JSON within the write limit, retrying 429/5xx and transport errors with backoff"""
+    content = fast_json.dumps(payload)
+
+    for attempt in range(WRITE_RETRIES):
+        last_attempt = attempt == WRITE_RETRIES - 1
+        try:
+            async with write_slots:
+                response = await client.post(url, headers=headers, content=content)
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or last_attempt:
+                return response
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+
+        await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+
+
 def extract_project_id(response: Dict[str, Any]) -> str:
     """Extract project ID from Archon response"""
     if "project_id" in response:
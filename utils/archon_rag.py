@@ -2,9 +2,44 @@
 Archon RAG Integration
 Queries Archon's knowledge base for similar projects and reusable components
 """
+import asyncio
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
 import httpx
-from typing import Optional, List, Dict, Any
-import yaml
+from typing import Optional, List, Dict, Any, Sequence
+
+from utils.config_loader import load_config_file
+
+# Reciprocal-rank fusion constant (score = sum of 1 / (RRF_K + rank))
+RRF_K = 60
+
+
+class _RateLimitedFilter(logging.Filter):
+    """Drop a record if the same message was already logged within the last `window` seconds"""
+
+    def __init__(self, window: float = 5.0):
+        super().__init__()
+        self.window = window
+        self._last_seen: Dict[tuple, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.msg, str(record.args))
+        now = time.monotonic()
+        if now - self._last_seen.get(key, float("-inf")) < self.window:
+            return False
+        if len(self._last_seen) >= 256:
+            # Forget messages whose window has passed
+            self._last_seen = {k: t for k, t in self._last_seen.items() if now - t < self.window}
+        self._last_seen[key] = now
+        return True
+
+
+log = logging.getLogger(__name__)
+log.addFilter(_RateLimitedFilter())
 
 
 class ArchonRAG:
@@ -13,24 +48,110 @@ class ArchonRAG:
     def __init__(self, api_url: Optional[str] = None, config_path: str = "config.yaml"):
         # Load config
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                self.api_url = api_url or config['archon']['api_url']
-                self.enabled = config['archon']['enabled']
+            config = load_config_file(config_path)
+            self.api_url = api_url or config['archon']['api_url']
+            self.enabled = config['archon']['enabled']
+            local_index = config['archon'].get('local_index')
         except (FileNotFoundError, KeyError):
             self.api_url = "http://localhost:8000"
             self.enabled = False
+            local_index = None
+
+        # Optional embedded FAISS index of past projects (<name>.faiss + <name>.jsonl
+        # metadata, one line per vector id), loaded on first query
+        self._index_path = Path(local_index) if local_index else None
+        self._index = None
+        self._entries: List[Dict[str, Any]] = []
+
+        # Pooled keep-alive client, created on first query (and again after aclose)
+        self._client: Optional[httpx.AsyncClient] = None
 
-        self.client = httpx.Client(timeout=30.0)
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client - repeat queries reuse pooled connections"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0
+                )
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client (a later query opens a new one)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     def is_enabled(self) -> bool:
         """Check if Archon integration is enabled"""
         return self.enabled
 
-    def search_similar_projects(
+    def _load_index(self):
+        """Load the local index and its metadata, or None if not configured/available"""
+        if self._index is not None or self._index_path is None:
+            return self._index
+
+        meta_path = self._index_path.with_suffix(".jsonl")
+        if not (self._index_path.exists() and meta_path.exists()):
+            log.warning("Archon local index not found: %s", self._index_path)
+            self._index_path = None
+            return None
+
+        try:
+            import faiss
+        except ImportError:
+            log.warning("Archon local index requires faiss. Run `pip install faiss-cpu sentence-transformers`.")
+            self._index_path = None
+            return None
+
+        self._index = faiss.read_index(str(self._index_path))
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            self._entries = [json.loads(line) for line in f if line.strip()]
+        return self._index
+
+    def _local_search(self, queries: Sequence[str], k: int) -> List[Dict[str, Any]]:
+        """
+        Nearest projects from the local index, each with a similarity score
+
+        All queries are embedded in one batch and searched in one call; with
+        several queries the per-query rankings are merged by reciprocal-rank
+        fusion (similarity is then the best cosine score across queries).
+        """
+        from utils.embeddings import embed
+
+        index = self._load_index()
+        if index is None or index.ntotal == 0:
+            return []
+
+        scores, ids = index.search(embed(list(queries), batch_size=len(queries)), min(k, index.ntotal))
+        if len(queries) == 1:
+            return [
+                {**self._entries[i], "similarity": float(score)}
+                for score, i in zip(scores[0], ids[0])
+                if i >= 0
+            ]
+
+        fused: Dict[int, float] = {}
+        best: Dict[int, float] = {}
+        for row_scores, row_ids in zip(scores, ids):
+            for rank, (score, i) in enumerate(zip(row_scores, row_ids)):
+                if i < 0:
+                    continue
+                fused[i] = fused.get(i, 0.0) + 1.0 / (RRF_K + rank + 1)
+                best[i] = max(best.get(i, -1.0), float(score))
+        top = sorted(fused, key=fused.get, reverse=True)[:k]
+        return [{**self._entries[i], "similarity": best[i]} for i in top]
+
+    async def search_similar_projects(
         self,
         query: str,
-        match_count: int = 3
+        match_count: int = 3,
+        variants: Sequence[str] = ()
     ) -> List[Dict[str, Any]]:
         """
         Search for similar projects in Archon
@@ -38,6 +159,7 @@ class ArchonRAG:
         Args:
             query: Search query (e.g., "trading bot", "diet tracking app")
             match_count: Number of results to return
+            variants: Rephrasings of the query, searched together and fused (multi-query RAG)
 
         Returns:
             List of similar projects with metadata
@@ -46,16 +168,20 @@ class ArchonRAG:
             return []
 
         try:
+            if self._index_path is not None:
+                # Embedding + KNN are CPU-bound - keep them off the event loop
+                return await asyncio.to_thread(self._local_search, [query, *variants], match_count)
+
             # This is a mock implementation
             # In reality, you'd call Archon's API endpoint
             # For now, return empty list (can be enhanced later)
             return []
 
         except Exception as e:
-            print(f"Warning: Archon RAG query failed: {e}")
+            log.warning("Archon RAG query failed: %s", e)
             return []
 
-    def find_reusable_components(
+    async def find_reusable_components(
         self,
         project_type: str,
         features: List[str]
@@ -74,15 +200,22 @@ class ArchonRAG:
             return []
 
         try:
+            if self._index_path is not None:
+                # Components recorded on the closest past projects
+                projects = await asyncio.to_thread(
+                    self._local_search, [f"{project_type}: {', '.join(features)}"], 5
+                )
+                return [component for project in projects for component in project.get("components", [])]
+
             # Mock implementation
             # Would query Archon's knowledge base for code snippets
             return []
 
         except Exception as e:
-            print(f"Warning: Component search failed: {e}")
+            log.warning("Archon component search failed: %s", e)
             return []
 
-    def get_lessons_learned(
+    async def get_lessons_learned(
         self,
         project_type: str
     ) -> Dict[str, Any]:
@@ -111,16 +244,21 @@ class ArchonRAG:
             }
 
         except Exception as e:
-            print(f"Warning: Lessons learned query failed: {e}")
+            log.warning("Archon lessons learned query failed: %s", e)
             return {"successes": [], "pitfalls": [], "recommendations": []}
 
 
 # Global instance
 _archon_instance = None
+_archon_lock = threading.Lock()
 
 def get_archon_rag(config_path: str = "config.yaml") -> ArchonRAG:
     """Get or create global Archon RAG instance"""
     global _archon_instance
-    if _archon_instance is None:
-        _archon_instance = ArchonRAG(config_path=config_path)
-    return _archon_instance
+    instance = _archon_instance
+    if instance is not None:
+        return instance
+    with _archon_lock:
+        if _archon_instance is None:
+            _archon_instance = ArchonRAG(config_path=config_path)
+        return _archon_instance
@@ -2,11 +2,65 @@
 LLM API wrapper for Ideenfinder
 Supports Anthropic Claude and OpenAI Chat Completions
 """
+import asyncio
+import functools
+import json
 import os
-from typing import Optional, Dict, Any, List
+import threading
+from typing import Optional, Dict, Any, List, Tuple, TypedDict, Union, AsyncIterator
 
-import yaml
-from anthropic import Anthropic
+from utils.config_loader import load_config_file
+from utils.llm_cache import LLMCache, get_llm_cache
+
+# User content is either plain text or a list of Anthropic content blocks
+# (used to mark stable prefixes with cache_control)
+Content = Union[str, List[Dict[str, Any]]]
+
+
+class Message(TypedDict):
+    """One conversation turn - a plain dict at runtime, so the SDKs serialize it as-is"""
+    role: str  # "user" / "assistant" (and "system" for OpenAI)
+    content: Content
+
+
+def cached_system(system_prompt: Content) -> List[Dict[str, Any]]:
+    """Wrap a static system prompt as a cacheable Anthropic system block
+
+    Lists are assumed to be pre-built blocks and are passed through unchanged.
+    """
+    if not isinstance(system_prompt, str):
+        return system_prompt
+    return [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def content_text(content: Content) -> str:
+    """Flatten content blocks to plain text (for providers without block support)"""
+    if isinstance(content, str):
+        return content
+    return "\n\n".join(block.get("text", "") for block in content)
+
+
+def openai_messages(system_prompt: Content, messages: List[Message]) -> List[Message]:
+    """Chat Completions message list: the system prompt followed by the flattened turns"""
+    return [
+        {"role": "system", "content": content_text(system_prompt)},
+        *({"role": m["role"], "content": content_text(m["content"])} for m in messages),
+    ]
+
+
+@functools.cache
+def http_options() -> Dict[str, Any]:
+    """Connection pool settings shared by every call to the provider (keep-alive + HTTP/2)"""
+    import httpx
+
+    return {
+        "http2": True,
+        "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+        "timeout": httpx.Timeout(60.0, connect=5.0),
+    }
+
+# Transient-error retries per request (SDK default is 2)
+DEFAULT_MAX_RETRIES = 5
 
 
 class ClaudeAPI:
@@ -24,8 +78,7 @@ class ClaudeAPI:
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         try:
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f) or {}
+            return load_config_file(config_path)
         except FileNotFoundError:
             return {}
 
@@ -35,7 +88,23 @@ class ClaudeAPI:
         if not self.api_key:
             raise ValueError("Anthropic API key not found. Set ANTHROPIC_API_KEY or claude.api_key.")
 
-        self.client = Anthropic(api_key=self.api_key)
+        # Imported here so modules that only need the helpers skip the SDK's import graph
+        from anthropic import Anthropic, AsyncAnthropic, DefaultHttpxClient, DefaultAsyncHttpxClient
+
+        # One sync and one async pool per ClaudeAPI instance, shared by every
+        # agent so consecutive and concurrent calls reuse TCP/TLS connections
+        # The SDK retries 408/409/429/5xx with jittered backoff and honours Retry-After
+        max_retries = claude_config.get("max_retries", DEFAULT_MAX_RETRIES)
+        self.client = Anthropic(
+            api_key=self.api_key,
+            max_retries=max_retries,
+            http_client=DefaultHttpxClient(**http_options())
+        )
+        self.async_client = AsyncAnthropic(
+            api_key=self.api_key,
+            max_retries=max_retries,
+            http_client=DefaultAsyncHttpxClient(**http_options())
+        )
         self.model = claude_config.get("model", "claude-sonnet-4")
         self.max_tokens = claude_config.get("max_tokens", 4096)
         self.temperature = claude_config.get("temperature", 0.7)
@@ -47,21 +116,73 @@ class ClaudeAPI:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY or openai.api_key.")
 
         try:
-            from openai import OpenAI
+            from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
         except ImportError as exc:
             raise ImportError(
                 "openai package not installed. Run `pip install openai` to use the OpenAI provider."
             ) from exc
 
-        self.client = OpenAI(api_key=self.api_key)
+        max_retries = openai_config.get("max_retries", DEFAULT_MAX_RETRIES)
+        self.client = OpenAI(
+            api_key=self.api_key,
+            max_retries=max_retries,
+            http_client=DefaultHttpxClient(**http_options())
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=max_retries,
+            http_client=DefaultAsyncHttpxClient(**http_options())
+        )
         self.model = openai_config.get("model", "gpt-4o")
         self.max_tokens = openai_config.get("max_tokens", 4096)
         self.temperature = openai_config.get("temperature", 0.7)
 
+    async def awarmup(self) -> None:
+        """
+        Open a pooled connection ahead of the first real request
+
+        Lists a single model (no tokens are spent) so DNS, TCP and TLS are
+        already done when an agent call lands. Failures are ignored - the
+        real request will report them.
+        """
+        # Same connection pool, but no retries - this is best effort
+        client = self.async_client.with_options(max_retries=0)
+        try:
+            if self.provider == "openai":
+                await client.models.list()
+            else:
+                await client.models.list(limit=1)
+        except Exception:
+            pass
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the SDK clients (sent to spawn-based worker processes)"""
+        state = self.__dict__.copy()
+        state.pop("client", None)
+        state.pop("async_client", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild only the SDK clients, reusing the parent's parsed config"""
+        self.__dict__.update(state)
+        if self.provider == "openai":
+            self._init_openai_client()
+        else:
+            self._init_claude_client(self.api_key)
+
+    def close(self) -> None:
+        """Close the sync connection pool (use aclose() for the async one)"""
+        self.client.close()
+
+    async def aclose(self) -> None:
+        """Close both connection pools"""
+        self.client.close()
+        await self.async_client.close()
+
     def send_message(
         self,
-        system_prompt: str,
-        user_message: str,
+        system_prompt: Content,
+        user_message: Content,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None
     ) -> str:
@@ -69,22 +190,172 @@ class ClaudeAPI:
         Send a single message to the configured provider and get response
 
         Args:
-            system_prompt: System instructions for the model
-            user_message: User's message/query
+            system_prompt: System instructions for the model (text or content blocks)
+            user_message: User's message/query (text or content blocks)
+            max_tokens: Override default max tokens
+            temperature: Override default temperature
+
+        Returns:
+            Provider response text
+        """
+        # Deterministic calls are answered from the shared response cache
+        cache, key = self._cache_key(system_prompt, user_message, max_tokens, temperature)
+        cached = cache.get(key)
+        if cached:
+            return cached
+
+        if self.provider == "openai":
+            response = self._send_openai(system_prompt, [{"role": "user", "content": user_message}], max_tokens, temperature)
+        else:
+            response = self._send_claude(system_prompt, user_message, max_tokens, temperature)
+        cache.set(key, response)
+        return response
+
+    async def asend_message(
+        self,
+        system_prompt: Content,
+        user_message: Content,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Async variant of send_message - does not block the event loop,
+        so agents gathered with asyncio run their requests concurrently
+
+        Args:
+            system_prompt: System instructions for the model (text or content blocks)
+            user_message: User's message/query (text or content blocks)
             max_tokens: Override default max tokens
             temperature: Override default temperature
 
         Returns:
             Provider response text
         """
+        # Not cached here - agents own caching of their calls (see BaseAgent.execute_stream)
+        messages: List[Message] = [{"role": "user", "content": user_message}]
+        if self.provider == "openai":
+            return await self._asend_openai(system_prompt, messages, max_tokens, temperature)
+        return await self._asend_claude(system_prompt, messages, max_tokens, temperature)
+
+    def _cache_key(
+        self,
+        system_prompt: Content,
+        user_message: Content,
+        max_tokens: Optional[int],
+        temperature: Optional[float]
+    ) -> Tuple[LLMCache, Optional[str]]:
+        """Shared response cache and the key for one message (None for sampled calls)"""
+        temp = self.temperature if temperature is None else temperature
+        cache = get_llm_cache(self.config)
+        return cache, cache.key("send_message", system_prompt, user_message, max_tokens or self.max_tokens, self.model, temp)
+
+    async def asend_structured(
+        self,
+        system_prompt: Content,
+        user_message: Content,
+        schema: Dict[str, Any],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a message and force the reply into a JSON schema via tool use
+
+        Args:
+            system_prompt: System instructions for the model (text or content blocks)
+            user_message: User's message/query (text or content blocks)
+            schema: JSON schema of the expected output
+            max_tokens: Override default max tokens
+            temperature: Override default temperature
+
+        Returns:
+            Parsed tool input matching the schema
+        """
+        messages: List[Message] = [{"role": "user", "content": user_message}]
+        temp = self.temperature if temperature is None else temperature
+
+        if self.provider == "openai":
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=openai_messages(system_prompt, messages),
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=temp,
+                    tools=[{"type": "function", "function": {"name": "emit_report", "parameters": schema}}],
+                    tool_choice={"type": "function", "function": {"name": "emit_report"}},
+                )
+                return json.loads(response.choices[0].message.tool_calls[0].function.arguments)
+            except Exception as e:
+                raise Exception(f"OpenAI API Error: {str(e)}")
+
+        try:
+            response = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temp,
+                system=cached_system(system_prompt),
+                messages=messages,
+                tools=[{"name": "emit_report", "description": "Emit the final report", "input_schema": schema}],
+                tool_choice={"type": "tool", "name": "emit_report"},
+            )
+            return response.content[0].input
+        except Exception as e:
+            raise Exception(f"Claude API Error: {str(e)}")
+
+    async def astream_message(
+        self,
+        system_prompt: Content,
+        user_message: Content,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a single message, yielding text chunks as they are generated
+
+        Args:
+            system_prompt: System instructions for the model (text or content blocks)
+            user_message: User's message/query (text or content blocks)
+            max_tokens: Override default max tokens
+            temperature: Override default temperature
+
+        Yields:
+            Response text chunks
+        """
+        messages: List[Message] = [{"role": "user", "content": user_message}]
+        temp = self.temperature if temperature is None else temperature
         if self.provider == "openai":
-            return self._send_openai(system_prompt, [{"role": "user", "content": user_message}], max_tokens, temperature)
-        return self._send_claude(system_prompt, user_message, max_tokens, temperature)
+            try:
+                stream = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=openai_messages(system_prompt, messages),
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=temp,
+                    stream=True,
+                )
+                async for chunk in stream:
+                    # The final chunk may carry no choices (usage only)
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                raise Exception(f"OpenAI API Error: {str(e)}")
+            return
+
+        try:
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temp,
+                system=cached_system(system_prompt),
+                messages=messages,
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            raise Exception(f"Claude API Error: {str(e)}")
 
     def send_with_context(
         self,
-        system_prompt: str,
-        messages: List[Dict[str, str]],
+        system_prompt: Content,
+        messages: List[Message],
         max_tokens: Optional[int] = None
     ) -> str:
         """
@@ -102,9 +373,160 @@ class ClaudeAPI:
             return self._send_openai(system_prompt, messages, max_tokens, None)
         return self._send_claude(system_prompt, messages, max_tokens, None, use_context=True)
 
+    async def asend_with_context(
+        self,
+        system_prompt: Content,
+        messages: List[Message],
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """
+        Async variant of send_with_context
+
+        Args:
+            system_prompt: System instructions
+            messages: List of {"role": "user"/"assistant", "content": "..."}
+            max_tokens: Override default
+
+        Returns:
+            Provider response text
+        """
+        if self.provider == "openai":
+            return await self._asend_openai(system_prompt, messages, max_tokens, None)
+        return await self._asend_claude(system_prompt, messages, max_tokens, None)
+
+    async def asend_batch(
+        self,
+        items: List[Tuple[Content, Content]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None
+    ) -> List[str]:
+        """
+        Run many independent prompts through the provider's batch endpoint
+
+        One submission and one poll loop instead of a request per prompt,
+        at the providers' discounted batch rate. Batches finish in minutes
+        rather than seconds, so this is meant for bulk jobs, not the
+        interactive pipeline.
+
+        Args:
+            items: (system_prompt, user_message) pairs
+            max_tokens: Override default max tokens
+            temperature: Override default temperature
+
+        Returns:
+            Response texts, in the order of items
+        """
+        # Only prompts missing from the response cache are submitted
+        # (lookups and stores run in one worker thread each - SQLite would block the loop)
+        keyed = [self._cache_key(system_prompt, user_message, max_tokens, temperature) for system_prompt, user_message in items]
+        results = await asyncio.to_thread(lambda: [cache.get(key) for cache, key in keyed])
+        missing = [i for i, result in enumerate(results) if not result]
+        if not missing:
+            return results
+
+        poll_seconds = self.config.get("batch", {}).get("poll_seconds", 10)
+        temp = self.temperature if temperature is None else temperature
+        submit = self._asend_openai_batch if self.provider == "openai" else self._asend_claude_batch
+        texts = await submit([items[i] for i in missing], max_tokens, temp, poll_seconds)
+
+        def store() -> None:
+            for i, text in zip(missing, texts):
+                cache, key = keyed[i]
+                cache.set(key, text)
+        await asyncio.to_thread(store)
+
+        for i, text in zip(missing, texts):
+            results[i] = text
+        return results
+
+    async def _asend_claude_batch(
+        self,
+        items: List[Tuple[Content, Content]],
+        max_tokens: Optional[int],
+        temperature: float,
+        poll_seconds: float,
+    ) -> List[str]:
+        try:
+            batch = await self.async_client.messages.batches.create(requests=[
+                {
+                    "custom_id": str(i),
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens or self.max_tokens,
+                        "temperature": temperature,
+                        "system": cached_system(system_prompt),
+                        "messages": [{"role": "user", "content": user_message}],
+                    },
+                }
+                for i, (system_prompt, user_message) in enumerate(items)
+            ])
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_seconds)
+                batch = await self.async_client.messages.batches.retrieve(batch.id)
+
+            texts: Dict[str, str] = {}
+            async for entry in await self.async_client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    raise Exception(f"request {entry.custom_id} {entry.result.type}")
+                texts[entry.custom_id] = entry.result.message.content[0].text
+            return [texts[str(i)] for i in range(len(items))]
+        except Exception as e:
+            raise Exception(f"Claude API Error: {str(e)}")
+
+    async def _asend_openai_batch(
+        self,
+        items: List[Tuple[Content, Content]],
+        max_tokens: Optional[int],
+        temperature: float,
+        poll_seconds: float,
+    ) -> List[str]:
+        try:
+            lines = [
+                json.dumps({
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": [
+                            {"role": "system", "content": content_text(system_prompt)},
+                            {"role": "user", "content": content_text(user_message)},
+                        ],
+                        "max_tokens": max_tokens or self.max_tokens,
+                        "temperature": temperature,
+                    },
+                })
+                for i, (system_prompt, user_message) in enumerate(items)
+            ]
+            batch_file = await self.async_client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch"
+            )
+            batch = await self.async_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(poll_seconds)
+                batch = await self.async_client.batches.retrieve(batch.id)
+            if batch.status != "completed" or not batch.output_file_id:
+                raise Exception(f"batch {batch.id} {batch.status}")
+
+            output = await self.async_client.files.content(batch.output_file_id)
+            texts: Dict[str, str] = {}
+            for line in output.text.splitlines():
+                entry = json.loads(line)
+                body = (entry.get("response") or {}).get("body") or {}
+                if not body.get("choices"):
+                    raise Exception(f"request {entry['custom_id']} failed: {entry.get('error')}")
+                texts[entry["custom_id"]] = body["choices"][0]["message"]["content"].strip()
+            return [texts[str(i)] for i in range(len(items))]
+        except Exception as e:
+            raise Exception(f"OpenAI API Error: {str(e)}")
+
     def _send_claude(
         self,
-        system_prompt: str,
+        system_prompt: Content,
         content: Any,
         max_tokens: Optional[int],
         temperature: Optional[float],
@@ -117,7 +539,27 @@ class ClaudeAPI:
                 model=self.model,
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temp,
-                system=system_prompt,
+                system=cached_system(system_prompt),
+                messages=messages,
+            )
+            return response.content[0].text
+        except Exception as e:
+            raise Exception(f"Claude API Error: {str(e)}")
+
+    async def _asend_claude(
+        self,
+        system_prompt: Content,
+        messages: List[Message],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+    ) -> str:
+        try:
+            temp = self.temperature if temperature is None else temperature
+            response = await self.async_client.messages.create(
+                model=self.model,
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temp,
+                system=cached_system(system_prompt),
                 messages=messages,
             )
             return response.content[0].text
@@ -126,17 +568,35 @@ class ClaudeAPI:
 
     def _send_openai(
         self,
-        system_prompt: str,
-        messages: List[Dict[str, str]],
+        system_prompt: Content,
+        messages: List[Message],
         max_tokens: Optional[int],
         temperature: Optional[float],
     ) -> str:
         try:
-            openai_messages = [{"role": "system", "content": system_prompt}] + messages
             temp = self.temperature if temperature is None else temperature
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=openai_messages,
+                messages=openai_messages(system_prompt, messages),
+                max_tokens=max_tokens or self.max_tokens,
+                temperature=temp,
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            raise Exception(f"OpenAI API Error: {str(e)}")
+
+    async def _asend_openai(
+        self,
+        system_prompt: Content,
+        messages: List[Message],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+    ) -> str:
+        try:
+            temp = self.temperature if temperature is None else temperature
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=openai_messages(system_prompt, messages),
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temp,
             )
@@ -147,10 +607,23 @@ class ClaudeAPI:
 
 # Global instance (can be imported)
 _claude_instance = None
+_claude_lock = threading.Lock()
 
 def get_claude_api(config_path: str = "config.yaml") -> ClaudeAPI:
-    """Get or create global Claude API instance"""
+    """Get or create global Claude API instance (only the first caller takes the lock)"""
     global _claude_instance
-    if _claude_instance is None:
-        _claude_instance = ClaudeAPI(config_path=config_path)
-    return _claude_instance
+    instance = _claude_instance
+    if instance is not None:
+        return instance
+    with _claude_lock:
+        if _claude_instance is None:
+            _claude_instance = ClaudeAPI(config_path=config_path)
+        return _claude_instance
+
+
+# Build the singleton at import so fork-based worker pools
+# (multiprocessing.get_context("fork") on Linux) inherit it instead of each
+# child parsing the config and setting up its own client; spawn-based pools
+# can pass the instance itself (see ClaudeAPI.__getstate__)
+if os.environ.get("IDEEFINDER_EAGER_INIT") == "1":
+    get_claude_api()
@@ -0,0 +1,57 @@
+"""
+Config Loader
+Parses the config file once per file version and shares the result
+"""
+import functools
+import os
+from typing import Dict, Any
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file; mtime is part of the cache key so edits are picked up"""
+    import yaml
+
+    # libyaml's C loader when available, pure-Python SafeLoader otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_toml(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a TOML file (same cache keying as _cached_yaml)"""
+    import tomllib
+
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _toml_sibling(path: str) -> str:
+    """config.toml next to the requested config, if it can be used (tomllib is 3.11+)"""
+    toml_path = os.path.splitext(path)[0] + ".toml"
+    if not os.path.exists(toml_path):
+        return ""
+    try:
+        import tomllib  # noqa: F401
+    except ImportError:
+        return ""
+    return toml_path
+
+
+def load_config_file(config_path: str) -> Dict[str, Any]:
+    """
+    Load a config file, reusing the parsed dict while the file is unchanged
+
+    A config.toml next to the given config.yaml takes precedence - it holds
+    the same keys and parses without PyYAML. The returned dict is shared
+    between callers - treat it as read-only.
+
+    Raises:
+        FileNotFoundError: If neither file exists
+    """
+    path = os.path.abspath(config_path)
+    toml_path = path if path.endswith(".toml") else _toml_sibling(path)
+    if toml_path:
+        return _cached_toml(toml_path, os.path.getmtime(toml_path))
+    return _cached_yaml(path, os.path.getmtime(path))
@@ -0,0 +1,32 @@
+"""
+Shared Embedding Model
+Loads the sentence-transformers model once per process for all caches and agents
+"""
+from functools import lru_cache
+from typing import List
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """Return the process-wide SentenceTransformer instance"""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as exc:
+        raise ImportError(
+            "sentence-transformers not installed. Run `pip install sentence-transformers`."
+        ) from exc
+
+    model = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+    return model
+
+
+def embed(texts: List[str], batch_size: int = 32):
+    """Embed texts in batches as normalized float32 vectors (shape: len(texts) x dim)"""
+    return get_embedder().encode(
+        texts,
+        batch_size=batch_size,
+        convert_to_numpy=True,
+        normalize_embeddings=True
+    ).astype("float32")
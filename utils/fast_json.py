@@ -0,0 +1,32 @@
+"""
+Fast JSON
+orjson when installed, stdlib json otherwise - both work on bytes
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (2-space indent for human-facing files)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
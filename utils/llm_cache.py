@@ -0,0 +1,163 @@
+"""
+LLM Response Cache
+Exact-match cache for agent prompts, backed by a local SQLite file
+"""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from utils import fast_json
+
+
+class LLMCache:
+    """Deterministic prompt -> response cache"""
+
+    def __init__(
+        self,
+        directory: str = "./.cache/llm",
+        ttl_seconds: Optional[int] = 7 * 24 * 3600,
+        enabled: bool = True,
+        memory_size: int = 1024
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.stats = {"hits": 0, "misses": 0}
+        self._db = None
+        # In-process LRU tier in front of SQLite: key -> (value, expires_at)
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, tuple[str, Optional[float]]]" = OrderedDict()
+        # Guards the memory tier and the shared connection - agents may call
+        # in from worker threads (see run_agents_parallel)
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(Path(directory) / "cache.sqlite"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def key(
+        agent: str,
+        system_prompt: str,
+        user_message: Any,
+        max_tokens: int,
+        model: str,
+        temperature: float = 0.0,
+        tools: Optional[Any] = None
+    ) -> Optional[str]:
+        """
+        Build the cache key for a single agent call
+
+        The key covers everything that shapes the response: model, messages,
+        temperature, token limit and any tool/output schema.
+
+        Returns None for sampled (temperature > 0) calls - their output is
+        not deterministic, so they are never cached.
+        """
+        if temperature > 0:
+            return None
+
+        payload = fast_json.dumps(
+            {
+                "agent": agent,
+                "sys": system_prompt,
+                "user": user_message,
+                "max_tokens": max_tokens,
+                "model": model,
+                "temperature": temperature,
+                "tools": tools,
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return cached response or None"""
+        if not self.enabled or key is None:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and (entry[1] is None or entry[1] >= now):
+                self._memory.move_to_end(key)
+                self.stats["hits"] += 1
+                return entry[0]
+
+            row = self._db.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or (row[1] is not None and row[1] < now):
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["hits"] += 1
+            self._remember(key, row[0], row[1])
+            return row[0]
+
+    async def aget(self, key: Optional[str]) -> Optional[str]:
+        """get() in a worker thread - a SQLite read would block the event loop"""
+        if not self.enabled or key is None:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: Optional[str], value: str, expire: Optional[int] = None) -> None:
+        """set() in a worker thread (see aget)"""
+        if self.enabled and key is not None:
+            await asyncio.to_thread(self.set, key, value, expire)
+
+    def _remember(self, key: str, value: str, expires_at: Optional[float]) -> None:
+        """Put an entry in the memory tier, evicting the least recently used (caller holds _lock)"""
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def set(self, key: Optional[str], value: str, expire: Optional[int] = None) -> None:
+        """Store a response (expire in seconds, defaults to ttl_seconds)"""
+        if not self.enabled or key is None:
+            return
+
+        ttl = self.ttl_seconds if expire is None else expire
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._db.commit()
+
+
+# Global instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+def get_llm_cache(config: Optional[Dict[str, Any]] = None) -> LLMCache:
+    """Get or create global LLM cache from the 'cache' config section"""
+    global _cache_instance
+    instance = _cache_instance
+    if instance is not None:
+        return instance
+    with _cache_lock:
+        if _cache_instance is None:
+            cache_config = (config or {}).get("cache", {})
+            _cache_instance = LLMCache(
+                directory=cache_config.get("directory", "./.cache/llm"),
+                ttl_seconds=cache_config.get("ttl_seconds", 7 * 24 * 3600),
+                enabled=cache_config.get("enabled", True),
+                memory_size=cache_config.get("memory_size", 1024),
+            )
+        return _cache_instance
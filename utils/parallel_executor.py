@@ -3,59 +3,150 @@ Parallel Agent Executor
 Runs multiple agents concurrently for Phase 2
 """
 import asyncio
-from typing import List, Callable, Any, Dict
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+import functools
+import inspect
+import os
+from typing import TYPE_CHECKING, List, Callable, Any, Awaitable, Dict, Optional
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+
+# Called with (agent_name, chunk) for every chunk a streaming agent yields
+ChunkCallback = Callable[[str, Any], None]
+
+# Agents in flight at once; extra agents queue here instead of in the HTTP pool
+DEFAULT_CONCURRENCY = int(os.getenv("AGENT_CONCURRENCY", "8"))
+
+
+def blocking(func: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+    """
+    Mark a synchronous agent callable (e.g. one calling ClaudeAPI.send_message)
+    to run in a worker thread, so it doesn't stall the other agents
+    """
+    return functools.partial(asyncio.to_thread, func)
+
+
+async def _resolve(
+    agent_name: str,
+    agent_func: Callable,
+    on_chunk: Optional[ChunkCallback],
+    slots: asyncio.Semaphore
+) -> Any:
+    """
+    Run one agent callable once a concurrency slot is free
+
+    The callable is called on the loop. A returned coroutine is awaited;
+    an async generator is drained, each chunk is handed to on_chunk as it
+    arrives, and the result is the joined text (or the list of chunks, if
+    they aren't strings). Blocking callables must be wrapped in blocking().
+    """
+    async with slots:
+        result = agent_func()
+        if inspect.isawaitable(result):
+            return await result
+        if not inspect.isasyncgen(result):
+            return result
+
+        chunks = []
+        async for chunk in result:
+            chunks.append(chunk)
+            if on_chunk is not None:
+                on_chunk(agent_name, chunk)
+    if all(isinstance(chunk, str) for chunk in chunks):
+        return "".join(chunks)
+    return chunks
+
+
+async def _run_all(coros: List[Awaitable]) -> List[Any]:
+    """
+    Run coroutines as sibling tasks and return their results in order
+
+    The first failure cancels the remaining siblings (no tokens are spent
+    on a batch that has already failed) and is re-raised as-is.
+    """
+    if hasattr(asyncio, "TaskGroup"):  # Python 3.11+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(coro) for coro in coros]
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0]
+        return [task.result() for task in tasks]
+
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+    return [task.result() for task in tasks]
+
+
+async def _run_tracked(
+    progress: "Progress",
+    agents: List[tuple[str, Callable]],
+    on_chunk: Optional[ChunkCallback],
+    slots: asyncio.Semaphore,
+    remove: bool = True
+) -> Dict[str, Any]:
+    """Run agents concurrently under one aggregate progress row, advanced as each finishes"""
+    task_id = progress.add_task(f"[cyan]Agents ({len(agents)})...", total=len(agents))
+
+    async def tracked(agent_name: str, agent_func: Callable) -> Any:
+        result = await _resolve(agent_name, agent_func, on_chunk, slots)
+        progress.update(task_id, advance=1, description=f"[cyan]{agent_name} done")
+        return result
+
+    try:
+        agent_results = await _run_all([tracked(name, func) for name, func in agents])
+    finally:
+        if remove:
+            progress.remove_task(task_id)
+    return {agent_name: result for (agent_name, _), result in zip(agents, agent_results)}
 
 
 async def run_agents_parallel(
     agents: List[tuple[str, Callable]],
-    show_progress: bool = True
+    show_progress: bool = True,
+    progress: Optional["Progress"] = None,
+    on_chunk: Optional[ChunkCallback] = None,
+    max_concurrency: int = DEFAULT_CONCURRENCY
 ) -> Dict[str, Any]:
     """
     Run multiple agents in parallel
 
     Args:
-        agents: List of (agent_name, async_function) tuples
+        agents: List of (agent_name, function) tuples - async generators are streamed, wrap sync ones in blocking()
         show_progress: Show rich progress bar
+        progress: Existing (already displayed) Progress to add the row to instead of opening a new one
+        on_chunk: Receives (agent_name, chunk) from streaming agents as chunks arrive
+        max_concurrency: Agents running at once (AGENT_CONCURRENCY env var, default 8)
 
     Returns:
         Dict mapping agent_name to result
     """
-    results = {}
+    slots = asyncio.Semaphore(max_concurrency)
+    if progress is not None:
+        return await _run_tracked(progress, agents, on_chunk, slots)
 
     if show_progress:
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         ) as progress:
+            return await _run_tracked(progress, agents, on_chunk, slots, remove=False)
 
-            # Create tasks
-            tasks = []
-            progress_tasks = {}
-
-            for agent_name, agent_func in agents:
-                task_id = progress.add_task(f"[cyan]{agent_name}...", total=100)
-                progress_tasks[agent_name] = task_id
-                tasks.append(agent_func())
-
-            # Run all agents concurrently
-            agent_results = await asyncio.gather(*tasks)
-
-            # Mark all complete
-            for agent_name in progress_tasks:
-                progress.update(progress_tasks[agent_name], completed=100)
-
-            # Map results
-            for (agent_name, _), result in zip(agents, agent_results):
-                results[agent_name] = result
-    else:
-        # Run without progress bar
-        tasks = [agent_func() for _, agent_func in agents]
-        agent_results = await asyncio.gather(*tasks)
-
-        for (agent_name, _), result in zip(agents, agent_results):
-            results[agent_name] = result
-
-    return results
+    # Run without progress bar
+    agent_results = await _run_all(
+        [_resolve(agent_name, agent_func, on_chunk, slots) for agent_name, agent_func in agents]
+    )
+    return {agent_name: result for (agent_name, _), result in zip(agents, agent_results)}
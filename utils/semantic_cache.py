@@ -0,0 +1,127 @@
+"""
+Semantic Response Cache
+Returns cached agent responses for near-duplicate prompts
+(e.g. "todo app with AI" vs "AI-powered task manager")
+"""
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+from utils.embeddings import embed, get_embedder
+
+DEFAULT_THRESHOLD = 0.92
+
+
+class SemanticCache:
+    """Per-agent nearest-neighbour cache over prompt embeddings"""
+
+    def __init__(
+        self,
+        agent_name: str,
+        directory: str = "./.cache/semantic",
+        threshold: float = DEFAULT_THRESHOLD,
+        enabled: bool = True
+    ):
+        self.agent_name = agent_name
+        self.threshold = threshold
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0}
+        self._index = None
+        self._entries: List[Dict[str, Any]] = []
+
+        slug = agent_name.lower().replace(' ', '_')
+        self._index_path = Path(directory) / f"{slug}.faiss"
+        self._meta_path = Path(directory) / f"{slug}.jsonl"
+
+        if self.enabled:
+            try:
+                import faiss  # noqa: F401
+                import sentence_transformers  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "Semantic cache requires faiss and sentence-transformers. "
+                    "Run `pip install faiss-cpu sentence-transformers` or set semantic_cache.enabled: false."
+                ) from exc
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+    def _load(self):
+        """Load (or create) the FAISS index and its metadata"""
+        import faiss
+
+        if self._index is not None:
+            return self._index
+
+        if self._index_path.exists() and self._meta_path.exists():
+            self._index = faiss.read_index(str(self._index_path))
+            with open(self._meta_path, 'r', encoding='utf-8') as f:
+                self._entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            dim = get_embedder().get_sentence_embedding_dimension()
+            self._index = faiss.IndexFlatIP(dim)
+        return self._index
+
+    def _embed(self, user_message: str):
+        return embed([f"{self.agent_name}|{user_message}"])
+
+    def get(self, user_message: str) -> Optional[str]:
+        """Return the response of the most similar prior prompt, if above threshold"""
+        if not self.enabled:
+            return None
+
+        index = self._load()
+        if index.ntotal == 0:
+            self.stats["misses"] += 1
+            return None
+
+        scores, ids = index.search(self._embed(user_message), 1)
+        if scores[0][0] > self.threshold:
+            self.stats["hits"] += 1
+            return self._entries[ids[0][0]]["response"]
+
+        self.stats["misses"] += 1
+        return None
+
+    async def aget(self, user_message: str) -> Optional[str]:
+        """get() in a worker thread - embedding is CPU-bound and would stall the event loop"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, user_message)
+
+    async def aset(self, user_message: str, response: str) -> None:
+        """set() in a worker thread (see aget)"""
+        if self.enabled:
+            await asyncio.to_thread(self.set, user_message, response)
+
+    def set(self, user_message: str, response: str) -> None:
+        """Add a prompt/response pair and persist the index"""
+        if not self.enabled:
+            return
+
+        import faiss
+
+        index = self._load()
+        index.add(self._embed(user_message))
+        entry = {
+            "response": response,
+            "agent_name": self.agent_name,
+            "created_at": time.time()
+        }
+        self._entries.append(entry)
+
+        faiss.write_index(index, str(self._index_path))
+        with open(self._meta_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+def get_semantic_cache(agent_name: str, config: Optional[Dict[str, Any]] = None) -> SemanticCache:
+    """Build a semantic cache for an agent from the 'semantic_cache' config section"""
+    cache_config = (config or {}).get("semantic_cache", {})
+    thresholds = cache_config.get("thresholds", {})
+    return SemanticCache(
+        agent_name=agent_name,
+        directory=cache_config.get("directory", "./.cache/semantic"),
+        threshold=thresholds.get(agent_name, cache_config.get("threshold", DEFAULT_THRESHOLD)),
+        enabled=cache_config.get("enabled", False),
+    )
@@ -0,0 +1,40 @@
+"""
+Spec Markdown Rendering
+Shared renderer for the markdown views of a project specification
+"""
+from typing import Dict, Any, List, Tuple
+
+# (header, spec section, key) - empty sections are skipped
+Section = Tuple[str, str, str]
+
+
+def render_spec_markdown(
+    spec: Dict[str, Any],
+    sections: List[Section],
+    overview_header: str = "Description",
+    spaced: bool = False
+) -> str:
+    """
+    Render the title, description and the given spec sections as markdown
+
+    Args:
+        spec: Project specification
+        sections: Sections to emit, in order
+        overview_header: Header for the project description
+        spaced: Blank line after headers and a --- rule after each section
+    """
+    gap = "\n\n" if spaced else "\n"
+    end = "\n\n---\n\n" if spaced else "\n\n"
+    # Each layout keeps the label its output has always used
+    generated = "**Generated**:" if spaced else "**Generated:**"
+
+    buf = [
+        f"# {spec['project']['title']}\n\n",
+        f"{generated} {spec['generated_at']}\n\n",
+        f"## {overview_header}{gap}{spec['project']['description']}{end}",
+    ]
+    for header, section, key in sections:
+        value = spec.get(section, {}).get(key)
+        if value:
+            buf.append(f"## {header}{gap}{value}{end}")
+    return "".join(buf)